@@ -1,21 +1,36 @@
 import asyncio
+import gzip
+import hashlib
 import logging
 import time
 import os
+import re
+import sys
+from contextlib import asynccontextmanager
+from itertools import chain
 from pathlib import Path
+from typing import Dict
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 import aiohttp
+import orjson
+
+try:
+    # Installed at import so any launch path gets uvloop's scheduler,
+    # not just `python main.py`; the loop doesn't exist yet at this point
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 from Backend.config import settings
 from Backend.cache import cache
-from Backend.lighter_client import lighter_client
+from Backend.lighter_client import WS_RECONCILE_INTERVAL, lighter_client, summarize_account_data
 from Backend.websocket_client import ws_client
 from Backend.websocket_server import manager
 from Backend.latency import latency_tracker
@@ -24,27 +39,64 @@ from Backend.error_collector import error_collector
 
 logger = logging.getLogger(__name__)
 
+# O(1) account lookup instead of scanning settings.accounts per request
+_accounts_by_index = {account.account_index: account for account in settings.accounts}
+
+# Hoisted once; used to flatten per-market order dicts on the hot path
+_chain_from_iterable = chain.from_iterable
+
+_ACCOUNT_NAME_NUM = re.compile(r'_(\d+)_')
+
+def _account_sort_key(account):
+    match = _ACCOUNT_NAME_NUM.search(account.get("name", ""))
+    return int(match.group(1)) if match else 999
+
 def _get_exchange_for_account_id(account_id: int) -> str:
-    for account in settings.accounts:
-        if account.account_index == account_id:
-            return account.exchange
-    return "lighter"
+    account = _accounts_by_index.get(account_id)
+    return account.exchange if account else "lighter"
+
+# Fixed-window is much cheaper per request than the default moving-window
+# strategy and is plenty for these read-only endpoints
+def _rate_limit_key(request: Request) -> str:
+    # Cheaper than slowapi's get_remote_address: read the ASGI scope
+    # directly and intern the address so repeat callers share one string
+    client = request.scope.get("client")
+    return sys.intern(client[0]) if client else "127.0.0.1"
+
+
+limiter = Limiter(key_func=_rate_limit_key, strategy="fixed-window", storage_uri="memory://")
 
-limiter = Limiter(key_func=get_remote_address)
-app = FastAPI(title="Lighter Broadcaster", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await _startup()
+    yield
+    await _shutdown()
+
+
+app = FastAPI(title="Lighter Broadcaster", version="1.0.0",
+              default_response_class=ORJSONResponse, lifespan=lifespan)
 
 _proxy_session: aiohttp.ClientSession = None
 
 FRONTEND_DIR = Path(__file__).parent.parent / "mFrontend" / "dist"
 
+# No global rate-limit middleware: the limiter is enforced by the
+# per-route decorators, so /health, /, and the WS endpoint skip the
+# key lookup entirely
 app.state.limiter = limiter
-app.add_middleware(SlowAPIMiddleware)
+# Level 1 keeps per-response CPU negligible while still cutting JSON
+# payloads by the bulk of their textual redundancy
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=1)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=settings.cors_origins,
+    # Credentials with a wildcard origin is spec-invalid and keeps the
+    # middleware on its match-any path; only allow them when CORS_ORIGINS
+    # names the dashboard hosts explicitly
+    allow_credentials="*" not in settings.cors_origins,
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
@@ -53,14 +105,14 @@ async def frontend_only_proxy_middleware(request: Request, call_next):
     """In FRONTEND_ONLY mode, proxy all /api/* requests to remote backend"""
     if settings.is_frontend_only() and request.url.path.startswith("/api/"):
         if not settings.remote_api_base:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"error": "REMOTE_API_BASE not configured"}
             )
         
         global _proxy_session
         if not _proxy_session:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={"error": "Proxy session not initialized"}
             )
@@ -100,7 +152,7 @@ async def frontend_only_proxy_middleware(request: Request, call_next):
                     )
         except aiohttp.ClientError as e:
             logger.error(f"Proxy middleware error for {target_url}: {e}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=502,
                 content={"error": f"Backend proxy error: {str(e)}"}
             )
@@ -109,13 +161,42 @@ async def frontend_only_proxy_middleware(request: Request, call_next):
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={"error": "Rate limit exceeded", "detail": str(exc.detail)}
     )
 
-@app.on_event("startup")
-async def startup():
+# Last-seen digest per upstream channel, used to drop repeat frames
+_ws_frame_hashes: Dict[str, bytes] = {}
+
+_VOLUME_FIELDS = ("total_volume", "monthly_volume", "weekly_volume", "daily_volume")
+
+# Handles to the collector's long-running tasks so shutdown can cancel
+# them instead of leaving them to die with the loop
+_background_tasks = []
+
+WS_WRITE_FLUSH_INTERVAL = 0.05
+WS_INBOX_MAXSIZE = 10000
+
+# Latest-wins staging area for WS-driven cache writes: bursty upstream
+# frames overwrite each other here and land in the cache in one batched
+# mset per flush tick instead of one locked write per frame
+_pending_ws_writes: Dict[str, tuple] = {}
+
+
+async def _ws_write_flusher():
+    try:
+        while True:
+            await asyncio.sleep(WS_WRITE_FLUSH_INTERVAL)
+            if _pending_ws_writes:
+                batch = dict(_pending_ws_writes)
+                _pending_ws_writes.clear()
+                await cache.mset(batch)
+    except asyncio.CancelledError:
+        pass
+
+
+async def _startup():
     logging.basicConfig(level=logging.INFO)
     logger.info(f"Starting Lighter Broadcaster in {settings.mode.value} mode...")
     
@@ -126,108 +207,140 @@ async def startup():
         
         await lighter_client.initialize(settings.accounts)
         
-        asyncio.create_task(lighter_client.start_polling())
+        _background_tasks.append(asyncio.create_task(lighter_client.start_polling()))
+        _background_tasks.append(asyncio.create_task(_portfolio_refresher()))
+        _background_tasks.append(asyncio.create_task(_ws_write_flusher()))
+        # Pre-open upstream keep-alive sockets off the startup path
+        _background_tasks.append(asyncio.create_task(lighter_client.warmup_pool()))
     
-    async def on_ws_message(data):
-        await manager.broadcast({"type": "lighter_update", "data": data})
+    async def _handle_orders(account_id: int, data):
+        orders = data.get("orders", [])
+        _pending_ws_writes[f"ws_orders:{account_id}"] = ({
+            "orders": orders,
+            "timestamp": time.time()
+        }, 120)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cached %d orders for account %d", len(orders), account_id)
+    
+    async def _handle_positions(account_id: int, data):
+        positions = data.get("positions", [])
+        _pending_ws_writes[f"ws_positions:{account_id}"] = ({
+            "positions": positions,
+            "timestamp": time.time()
+        }, 120)
+        if positions and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cached %d positions for account %d", len(positions), account_id)
+    
+    async def _handle_trades(account_id: int, data):
+        new_trades = data.get("trades", {})
+        volumes = {k: data.get(k) for k in _VOLUME_FIELDS}
         
-        channel = data.get("channel", "")
-        msg_type = data.get("type", "")
+        MAX_TRADES_PER_MARKET = 500
         
-        if "account_all_orders" in channel:
-            parts = channel.replace("account_all_orders:", "").replace("account_all_orders/", "")
-            try:
-                account_id = int(parts)
-                orders = data.get("orders", [])
-                await cache.set(f"ws_orders:{account_id}", {
-                    "orders": orders,
-                    "timestamp": time.time()
-                }, ttl=120)
-                logger.info(f"Cached {len(orders)} orders for account {account_id}")
-            except (ValueError, TypeError) as e:
-                logger.error(f"Failed to parse orders channel {channel}: {e}")
+        existing = await cache.get(f"ws_trades:{account_id}")
+        existing_data = existing.get("data", existing) if existing else {}
+        existing_trades = existing_data.get("trades", {}) if existing_data else {}
         
-        elif "account_all_positions" in channel:
-            parts = channel.replace("account_all_positions:", "").replace("account_all_positions/", "")
-            try:
-                account_id = int(parts)
-                positions = data.get("positions", [])
-                await cache.set(f"ws_positions:{account_id}", {
-                    "positions": positions,
-                    "timestamp": time.time()
-                }, ttl=120)
-                if positions:
-                    logger.debug(f"Cached {len(positions)} positions for account {account_id}")
-            except (ValueError, TypeError):
-                pass
+        if not isinstance(existing_trades, dict):
+            existing_trades = {}
+        if not isinstance(new_trades, dict):
+            new_trades = {}
         
-        elif "account_all_trades" in channel:
-            parts = channel.replace("account_all_trades:", "").replace("account_all_trades/", "")
-            try:
-                account_id = int(parts)
-                new_trades = data.get("trades", {})
-                volumes = {
-                    "total_volume": data.get("total_volume"),
-                    "monthly_volume": data.get("monthly_volume"),
-                    "weekly_volume": data.get("weekly_volume"),
-                    "daily_volume": data.get("daily_volume")
-                }
-                
-                MAX_TRADES_PER_MARKET = 500
-                
-                existing = await cache.get(f"ws_trades:{account_id}")
-                existing_data = existing.get("data", existing) if existing else {}
-                existing_trades = existing_data.get("trades", {}) if existing_data else {}
-                
-                if not isinstance(existing_trades, dict):
-                    existing_trades = {}
-                if not isinstance(new_trades, dict):
-                    new_trades = {}
+        exchange = _get_exchange_for_account_id(account_id)
+        
+        for market_id, market_trades in new_trades.items():
+            if not isinstance(market_trades, list):
+                continue
+            
+            if market_id in existing_trades:
+                if not isinstance(existing_trades[market_id], list):
+                    existing_trades[market_id] = []
                 
-                exchange = _get_exchange_for_account_id(account_id)
+                existing_ids = set()
+                for t in existing_trades[market_id]:
+                    trade_key = t.get("id") or t.get("trade_id") or t.get("timestamp")
+                    if trade_key:
+                        existing_ids.add(trade_key)
                 
-                for market_id, market_trades in new_trades.items():
-                    if not isinstance(market_trades, list):
-                        continue
-                    
-                    if market_id in existing_trades:
-                        if not isinstance(existing_trades[market_id], list):
-                            existing_trades[market_id] = []
-                        
-                        existing_ids = set()
-                        for t in existing_trades[market_id]:
-                            trade_key = t.get("id") or t.get("trade_id") or t.get("timestamp")
-                            if trade_key:
-                                existing_ids.add(trade_key)
-                        
-                        for trade in market_trades:
-                            trade_key = trade.get("id") or trade.get("trade_id") or trade.get("timestamp")
-                            if trade_key and trade_key not in existing_ids:
-                                existing_trades[market_id].append(trade)
-                                existing_ids.add(trade_key)
-                                if supabase_client.is_initialized:
-                                    asyncio.create_task(supabase_client.save_trade(account_id, trade, exchange))
-                        
-                        if len(existing_trades[market_id]) > MAX_TRADES_PER_MARKET:
-                            existing_trades[market_id] = existing_trades[market_id][-MAX_TRADES_PER_MARKET:]
-                    else:
-                        existing_trades[market_id] = market_trades[-MAX_TRADES_PER_MARKET:]
+                for trade in market_trades:
+                    trade_key = trade.get("id") or trade.get("trade_id") or trade.get("timestamp")
+                    if trade_key and trade_key not in existing_ids:
+                        existing_trades[market_id].append(trade)
+                        existing_ids.add(trade_key)
                         if supabase_client.is_initialized:
-                            for trade in market_trades:
-                                asyncio.create_task(supabase_client.save_trade(account_id, trade, exchange))
+                            asyncio.create_task(supabase_client.save_trade(account_id, trade, exchange))
                 
-                await cache.set(f"ws_trades:{account_id}", {
-                    "trades": existing_trades,
-                    "volumes": volumes,
-                    "timestamp": time.time()
-                }, ttl=3600)
-            except (ValueError, TypeError):
-                pass
+                if len(existing_trades[market_id]) > MAX_TRADES_PER_MARKET:
+                    existing_trades[market_id] = existing_trades[market_id][-MAX_TRADES_PER_MARKET:]
+            else:
+                existing_trades[market_id] = market_trades[-MAX_TRADES_PER_MARKET:]
+                if supabase_client.is_initialized:
+                    for trade in market_trades:
+                        asyncio.create_task(supabase_client.save_trade(account_id, trade, exchange))
         
+        await cache.set(f"ws_trades:{account_id}", {
+            "trades": existing_trades,
+            "volumes": volumes,
+            "timestamp": time.time()
+        }, ttl=3600)
+    
+    channel_handlers = {
+        "account_all_orders": _handle_orders,
+        "account_all_positions": _handle_positions,
+        "account_all_trades": _handle_trades,
+    }
+    
+    async def _process_ws_message(data):
+        channel = data.get("channel", "")
+        
+        # Repeated heartbeats and unchanged snapshots would otherwise be
+        # re-cached and re-broadcast to every client; drop them up front
+        dedupe_key = channel or str(data.get("account_index", ""))
+        digest = hashlib.blake2b(orjson.dumps(data), digest_size=8).digest()
+        if _ws_frame_hashes.get(dedupe_key) == digest:
+            return
+        _ws_frame_hashes[dedupe_key] = digest
+        
+        manager.enqueue({"type": "lighter_update", "data": data})
+        
+        # One split and one dict lookup instead of chained substring
+        # tests and replace() allocations per frame
+        head, _, tail = channel.replace("/", ":").partition(":")
+        handler = channel_handlers.get(head)
+        if handler is not None:
+            try:
+                await handler(int(tail), data)
+            except (ValueError, TypeError) as e:
+                logger.error("Failed to handle channel %s: %s", channel, e)
         elif "account_index" in data:
-            await cache.set(f"ws_update:{data['account_index']}", data)
+            _pending_ws_writes[f"ws_update:{data['account_index']}"] = (data, None)
+    
+    inbox: asyncio.Queue = asyncio.Queue(maxsize=WS_INBOX_MAXSIZE)
+    
+    async def _inbox_consumer():
+        try:
+            while True:
+                data = await inbox.get()
+                try:
+                    await _process_ws_message(data)
+                except Exception as e:
+                    logger.error("Error processing upstream frame: %s", e)
+        except asyncio.CancelledError:
+            pass
+    
+    def on_ws_message(data):
+        # Sync callback: hand the frame to the consumer without spawning
+        # a task per message or suspending the upstream receive loop.
+        # When the inbox is full the oldest frame is dropped; consumers
+        # only ever need the latest snapshot per channel anyway.
+        try:
+            inbox.put_nowait(data)
+        except asyncio.QueueFull:
+            inbox.get_nowait()
+            inbox.put_nowait(data)
     
     if settings.is_collector():
+        _background_tasks.append(asyncio.create_task(_inbox_consumer()))
         ws_client.set_signer_clients(lighter_client.signer_clients)
         ws_client.add_callback(on_ws_message)
         await ws_client.start()
@@ -240,72 +353,149 @@ async def startup():
         else:
             logger.warning("FRONTEND_ONLY mode: No REMOTE_API_BASE configured!")
 
-@app.on_event("shutdown")
-async def shutdown():
+async def _shutdown():
     logger.info("Shutting down Lighter Broadcaster...")
     if settings.is_collector():
-        await ws_client.stop()
-        await lighter_client.close()
+        for task in _background_tasks:
+            task.cancel()
+        await asyncio.gather(
+            *_background_tasks,
+            ws_client.stop(),
+            lighter_client.close(),
+            return_exceptions=True
+        )
+        _background_tasks.clear()
     else:
         global _proxy_session
         if _proxy_session:
             await _proxy_session.close()
 
+# Fields knowable at import time, merged into every status payload
+_STATIC_STATUS = {
+    "poll_interval": settings.poll_interval,
+    "accounts_configured": len(settings.accounts)
+}
+
+_HEALTH_TTL = 0.5
+_health_cache = {"ts": 0.0, "body": None}
+
+
 @app.get("/health")
 async def health_check():
-    return {
+    # Probed at monitoring cadence: serve the same encoded bytes for
+    # half a second rather than rebuilding a near-constant payload
+    now = time.time()
+    if _health_cache["body"] is not None and now - _health_cache["ts"] < _HEALTH_TTL:
+        return Response(content=_health_cache["body"], media_type="application/json")
+    body = orjson.dumps({
         "status": "healthy",
-        "accounts_configured": len(settings.accounts),
+        "accounts_configured": _STATIC_STATUS["accounts_configured"],
         "ws_connected": ws_client.is_connected,
         "broadcast_clients": manager.connection_count
-    }
+    })
+    _health_cache.update(ts=now, body=body)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/accounts")
 @limiter.limit(settings.rate_limit)
 async def get_accounts(request: Request):
-    cached_data = await cache.get_all()
-    accounts = {}
-    
-    for key, value in cached_data.items():
-        if key.startswith("account:"):
-            account_id = key.replace("account:", "")
-            accounts[account_id] = value
-    
-    return {"accounts": accounts}
+    # Stitch the response from the blobs serialized at cache-write time;
+    # only the per-request age is formatted here
+    now = time.time()
+    parts = []
+    # ETag covers the entry contents and write times, not the derived
+    # per-request age field, so idle polls actually match
+    hasher = hashlib.blake2b(digest_size=8)
+    for account in settings.accounts:
+        entry = await cache.get_entry(f"account:{account.account_index}")
+        if entry is None:
+            continue
+        blob = entry.blob if entry.blob is not None else orjson.dumps(entry.data)
+        hasher.update(blob)
+        parts.append(
+            b'"%d":{"data":' % account.account_index + blob +
+            b',"age":%.3f,"ttl":%d}' % (now - entry.timestamp, entry.ttl)
+        )
+    etag = hasher.hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=b'{"accounts":{' + b",".join(parts) + b"}}",
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
 
 @app.get("/api/accounts/{account_index}")
 @limiter.limit(settings.rate_limit)
 async def get_account(request: Request, account_index: int):
-    cached = await cache.get(f"account:{account_index}")
-    if cached:
-        return {"account": cached, "source": "cache"}
+    entry = await cache.get_entry(f"account:{account_index}", allow_expired=True)
+    if entry is not None:
+        if time.time() - entry.timestamp <= entry.ttl:
+            if entry.blob is not None:
+                # Reuse the bytes serialized at cache-write time
+                body = b'{"account":' + entry.blob + b',"source":"cache"}'
+                return Response(content=body, media_type="application/json")
+            return {"account": entry.data, "source": "cache"}
+        account = _accounts_by_index.get(account_index)
+        if account is not None:
+            # Stale-while-revalidate: answer with the expired entry now
+            # and refresh the cache in the background
+            asyncio.create_task(lighter_client.fetch_account_data(account.name, account_index))
+            return {"account": entry.data, "source": "stale"}
     
-    for account in settings.accounts:
-        if account.account_index == account_index:
-            data = await lighter_client.fetch_account_data(account.name, account_index)
-            if data:
-                return {"account": data, "source": "fresh"}
+    account = _accounts_by_index.get(account_index)
+    if account is not None:
+        data = await lighter_client.fetch_account_data(account.name, account_index)
+        if data:
+            return {"account": data, "source": "fresh"}
     
     raise HTTPException(status_code=404, detail="Account not found")
 
+_STATUS_TTL = 1.0
+_status_cache = {"ts": 0.0, "body": None, "etag": None}
+
+
 @app.get("/api/status")
-async def get_status():
-    cache_stats = await cache.get_stats()
-    return {
-        "polling": lighter_client.running,
-        "poll_interval": settings.poll_interval,
-        "ws_connected": ws_client.is_connected,
-        "broadcast_clients": manager.connection_count,
-        "accounts_configured": len(settings.accounts),
-        "cache": cache_stats
-    }
+async def get_status(request: Request):
+    now = time.time()
+    if _status_cache["body"] is not None and now - _status_cache["ts"] < _STATUS_TTL:
+        body = _status_cache["body"]
+        etag = _status_cache["etag"]
+    else:
+        cache_stats = await cache.get_stats()
+        body = orjson.dumps({
+            **_STATIC_STATUS,
+            "polling": lighter_client.running,
+            "ws_connected": ws_client.is_connected,
+            "broadcast_clients": manager.connection_count,
+            "cache": cache_stats
+        })
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        _status_cache.update(ts=now, body=body, etag=etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
 
-@app.get("/api/latency")
-async def get_latency():
-    cached_data = await cache.get_all()
-    live_accounts = sum(1 for k, v in cached_data.items() 
-                       if k.startswith("account:") and 
-                       (time.time() - v.get("data", v).get("last_update", 0)) < 10)
+_LATENCY_TTL = 1.0
+_latency_cache = {"ts": 0.0, "metrics": None}
+
+
+async def _latency_metrics():
+    # Shared by /api/latency and the dashboard snapshot; the underlying
+    # tracker aggregates don't move faster than the poll cadence anyway
+    now = time.time()
+    if _latency_cache["metrics"] is not None and now - _latency_cache["ts"] < _LATENCY_TTL:
+        return _latency_cache["metrics"]
+    # Liveness is "marker key still exists": the poller writes
+    # account_live:{i} with a 10s TTL, so counting live accounts is one
+    # batched lookup with no per-entry field inspection
+    live_accounts = len(await cache.mget(
+        [f"account_live:{account.account_index}" for account in settings.accounts]
+    ))
     
     latency_tracker.set_account_stats(
         active=live_accounts,
@@ -314,144 +504,227 @@ async def get_latency():
     )
     latency_tracker.set_ws_status(ws_client.is_connected)
     
-    return latency_tracker.get_metrics()
+    metrics = latency_tracker.get_metrics()
+    _latency_cache.update(ts=now, metrics=metrics)
+    return metrics
+
+
+@app.get("/api/latency")
+async def get_latency():
+    return await _latency_metrics()
+
+
+@app.get("/api/dashboard_snapshot")
+async def get_dashboard_snapshot():
+    """Everything the dashboard polls, in a single round trip.
+
+    Collapses the frontend's parallel per-panel fetches into one request
+    so each poll pays routing, middleware, and encoding overhead once.
+    """
+    portfolio = _portfolio_cache["payload"]
+    if portfolio is None:
+        portfolio = await _build_portfolio()
+    return ORJSONResponse({
+        "portfolio": portfolio,
+        "ws_health": ws_client.get_all_health_status(),
+        "rest_health": lighter_client.get_all_health_status(),
+        "latency": await _latency_metrics(),
+        "errors": {
+            "errors": error_collector.get_recent_errors(limit=30),
+            "summary": error_collector.get_error_summary()
+        },
+        "raw_ws": ws_client.get_all_raw_messages(limit=20),
+        "control": {
+            "rest_paused": lighter_client.is_paused,
+            "ws_paused": ws_client.is_paused,
+            "paused": lighter_client.is_paused and ws_client.is_paused,
+            "rest_running": lighter_client.running,
+            "ws_running": ws_client.running
+        }
+    })
+
+PORTFOLIO_CACHE_TTL = 1.0
+
+_portfolio_cache = {"ts": 0.0, "version": -1, "payload": None, "body": None, "etag": None}
+_portfolio_lock = asyncio.Lock()
+
+
+async def _portfolio_refresher():
+    """Rebuild the portfolio snapshot in the background on cache changes.
+
+    Keeps /api/portfolio a plain bytes read under steady polling; the
+    endpoint's single-flight rebuild remains only as the cold-start path.
+    """
+    while True:
+        try:
+            version = cache.version
+            # touch() refreshes timestamps without bumping the version, so a
+            # quiet steady state never triggers a version change; rebuild on
+            # age too so last_update and data ages keep moving
+            stale = time.time() - _portfolio_cache["ts"] > WS_RECONCILE_INTERVAL
+            if _portfolio_cache["version"] != version or stale:
+                async with _portfolio_lock:
+                    if _portfolio_cache["version"] != version or stale:
+                        payload = await _build_portfolio()
+                        body = orjson.dumps(payload)
+                        _portfolio_cache.update(
+                            ts=time.time(), version=version, payload=payload, body=body,
+                            etag=hashlib.blake2b(body, digest_size=8).hexdigest()
+                        )
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error("Portfolio snapshot rebuild failed: %s", e)
+        await asyncio.sleep(PORTFOLIO_CACHE_TTL)
+
+def _snapshot_response(request: Request):
+    """304 if the client already holds the current snapshot, else the bytes"""
+    etag = _portfolio_cache["etag"]
+    if etag is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=_portfolio_cache["body"],
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"} if etag else None
+    )
+
 
 @app.get("/api/portfolio")
-async def get_portfolio():
-    import time
-    cached_data = await cache.get_all()
-    accounts_list = []
+async def get_portfolio(request: Request):
+    if _portfolio_cache["body"] is not None:
+        # The background refresher keeps the snapshot current; serving
+        # whatever is latest keeps this handler a plain bytes read and
+        # never blocks the event loop on a rebuild
+        return _snapshot_response(request)
+
+    async with _portfolio_lock:
+        # Cold start only: build once while concurrent callers wait
+        if _portfolio_cache["body"] is None:
+            payload = await _build_portfolio()
+            body = orjson.dumps(payload)
+            _portfolio_cache.update(
+                ts=time.time(), version=cache.version, payload=payload, body=body,
+                etag=hashlib.blake2b(body, digest_size=8).hexdigest()
+            )
+        return _snapshot_response(request)
+
+
+async def _build_portfolio():
+    # The key set is known from configuration, so fetch everything in one
+    # batched lookup (a single lock acquisition) instead of three
+    # namespace scans
+    keys = []
+    for account in settings.accounts:
+        idx = account.account_index
+        keys.append(f"account:{idx}")
+        keys.append(f"account_live:{idx}")
+        keys.append(f"ws_orders:{idx}")
+        keys.append(f"ws_trades:{idx}")
+    entries = await cache.mget(keys)
     
-    total_equity = 0
-    total_unrealized_pnl = 0
-    total_margin_used = 0
-    total_positions = 0
-    total_active_orders = 0
-    total_trades = 0
+    accounts_list = []
+    accounts_live = 0
     
     now = time.time()
     
-    for key, value in cached_data.items():
-        if key.startswith("account:"):
-            account_data = value.get("data", value)
-            raw_data = account_data.get("raw_data", {})
-            account_index = account_data.get("account_index")
-            
-            ws_orders_key = f"ws_orders:{account_index}"
-            ws_orders_entry = cached_data.get(ws_orders_key, {})
-            ws_orders_inner = ws_orders_entry.get("data", ws_orders_entry) if ws_orders_entry else {}
-            ws_orders_raw = ws_orders_inner.get("orders", []) if isinstance(ws_orders_inner, dict) else []
-            
-            if isinstance(ws_orders_raw, dict):
-                ws_orders = []
-                for market_orders in ws_orders_raw.values():
-                    if isinstance(market_orders, list):
-                        ws_orders.extend(market_orders)
-            else:
-                ws_orders = ws_orders_raw if isinstance(ws_orders_raw, list) else []
-            
-            active_orders = ws_orders if ws_orders else (account_data.get("active_orders", []) or [])
-            
-            ws_trades_key = f"ws_trades:{account_index}"
-            ws_trades_entry = cached_data.get(ws_trades_key, {})
-            ws_trades = ws_trades_entry.get("data", ws_trades_entry) if ws_trades_entry else {}
-            
-            last_update = account_data.get("last_update", 0)
+    for account in settings.accounts:
+        account_index = account.account_index
+        value = entries.get(f"account:{account_index}")
+        if value is None:
+            continue
+        account_data = value.get("data", value)
+        raw_data = account_data.get("raw_data", {})
             
-            is_live = (now - last_update) < 10
+        ws_orders_entry = entries.get(f"ws_orders:{account_index}", {})
+        # EAFP: our own writers control these shapes, so optimize for the
+        # expected dict forms and fall back only when a lookup fails
+        try:
+            ws_orders_raw = ws_orders_entry.get("data", ws_orders_entry).get("orders", [])
+        except AttributeError:
+            ws_orders_raw = []
+        try:
+            ws_orders = list(_chain_from_iterable(ws_orders_raw.values()))
+        except AttributeError:
+            ws_orders = ws_orders_raw or []
             
-            equity = 0
-            available_balance = 0
-            unrealized_pnl = 0
-            margin_used = 0
-            margin_ratio = 0
-            volume_24h = 0
-            positions = []
-            trades = []
+        active_orders = ws_orders if ws_orders else (account_data.get("active_orders", []) or [])
             
-            if isinstance(raw_data, dict):
-                acc_list = raw_data.get("accounts", [])
-                if acc_list and len(acc_list) > 0:
-                    acc = acc_list[0]
-                    equity = float(acc.get("collateral", 0) or 0)
-                    available_balance = float(acc.get("available_balance", 0) or 0)
-                    margin_used = equity - available_balance
-                    
-                    pos_list = acc.get("positions", [])
-                    for pos in pos_list:
-                        pnl = float(pos.get("unrealized_pnl", 0) or 0)
-                        unrealized_pnl += pnl
-                        pos_size = float(pos.get("position", 0) or 0)
-                        if pos_size != 0:
-                            positions.append(pos)
-                    
-                    if equity > 0:
-                        margin_ratio = margin_used / equity
-                
-                trades = raw_data.get("trades", []) or []
-                
-                day_ago = now - 86400
-                for trade in trades:
-                    trade_ts = float(trade.get("timestamp", 0) or 0)
-                    trade_time = trade_ts / 1000 if trade_ts > 10000000000 else trade_ts
-                    if trade_time >= day_ago:
-                        size = abs(float(trade.get("size", 0) or 0))
-                        price = float(trade.get("price", 0) or 0)
-                        volume_24h += size * price
+        ws_trades_entry = entries.get(f"ws_trades:{account_index}", {})
+        ws_trades = ws_trades_entry.get("data", ws_trades_entry) if ws_trades_entry else {}
             
-            ws_volumes = ws_trades.get("volumes", {}) if ws_trades else {}
-            ws_trades_raw = ws_trades.get("trades", {}) if ws_trades else {}
+        # The payload's last_update field goes stale on quiet accounts:
+        # unchanged polls touch the entry instead of rewriting it, so the
+        # entry's write time (exposed by mget as age) is the real age
+        last_update = now - value["age"]
             
-            if isinstance(ws_trades_raw, dict):
-                ws_trades_list = []
-                for market_trades in ws_trades_raw.values():
-                    if isinstance(market_trades, list):
-                        ws_trades_list.extend(market_trades)
-            else:
-                ws_trades_list = ws_trades_raw if isinstance(ws_trades_raw, list) else []
+        is_live = f"account_live:{account_index}" in entries
+        if is_live:
+            accounts_live += 1
+
+        summary = account_data.get("portfolio_summary")
+        if summary is None:
+            # Older cache entries (or WS-only writers) lack the
+            # precomputed aggregates; derive them on demand and stash
+            # the result on the entry so the next rebuild reads it back
+            summary = account_data["portfolio_summary"] = summarize_account_data(raw_data, now)
+
+        equity = summary["equity"]
+        available_balance = summary["available_balance"]
+        unrealized_pnl = summary["unrealized_pnl"]
+        margin_used = summary["margin_used"]
+        margin_ratio = summary["margin_ratio"]
+        volume_24h = summary["volume_24h"]
+        positions = summary["positions"]
+        trades = summary["trades"]
             
-            all_trades = ws_trades_list if ws_trades_list else trades
+        ws_volumes = ws_trades.get("volumes", {}) if ws_trades else {}
+        ws_trades_raw = ws_trades.get("trades", {}) if ws_trades else {}
             
-            account_index_val = account_data.get("account_index", 0)
-            exchange = _get_exchange_for_account_id(account_index_val)
+        try:
+            ws_trades_list = list(_chain_from_iterable(ws_trades_raw.values()))
+        except AttributeError:
+            ws_trades_list = ws_trades_raw or []
             
-            account_entry = {
-                "account_index": str(account_index_val),
-                "name": account_data.get("account_name", ""),
-                "exchange": exchange,
-                "is_live": is_live,
-                "last_update": int(last_update),
-                "equity": equity,
-                "available_balance": available_balance,
-                "unrealized_pnl": unrealized_pnl,
-                "margin_used": margin_used,
-                "margin_ratio": margin_ratio,
-                "volume_24h": ws_volumes.get("daily_volume") or volume_24h,
-                "total_volume": ws_volumes.get("total_volume"),
-                "monthly_volume": ws_volumes.get("monthly_volume"),
-                "weekly_volume": ws_volumes.get("weekly_volume"),
-                "positions": positions,
-                "active_orders": active_orders,
-                "trades": all_trades
-            }
-            accounts_list.append(account_entry)
+        all_trades = ws_trades_list if ws_trades_list else trades
             
-            total_equity += equity
-            total_unrealized_pnl += unrealized_pnl
-            total_margin_used += margin_used
-            total_positions += len(positions)
-            total_active_orders += len(active_orders)
-            total_trades += len(all_trades)
-    
-    def get_account_sort_key(account):
-        name = account.get("name", "")
-        import re
-        match = re.search(r'_(\d+)_', name)
-        if match:
-            return int(match.group(1))
-        return 999
-    
-    accounts_list.sort(key=get_account_sort_key)
+        account_entry = {
+            "account_index": str(account_index),
+            "name": account_data.get("account_name", ""),
+            "exchange": account.exchange,
+            "is_live": is_live,
+            "last_update": int(last_update),
+            "equity": equity,
+            "available_balance": available_balance,
+            "unrealized_pnl": unrealized_pnl,
+            "margin_used": margin_used,
+            "margin_ratio": margin_ratio,
+            "volume_24h": ws_volumes.get("daily_volume") or volume_24h,
+            "total_volume": ws_volumes.get("total_volume"),
+            "monthly_volume": ws_volumes.get("monthly_volume"),
+            "weekly_volume": ws_volumes.get("weekly_volume"),
+            "positions": positions,
+            "open_positions_count": len(positions),
+            # The UI renders at most 5 orders and 3 trades; send only
+            # those plus the full counts instead of the whole arrays
+            "active_orders": active_orders[:5],
+            "active_orders_count": len(active_orders),
+            "trades": all_trades[:3],
+            "trades_count": len(all_trades)
+        }
+        accounts_list.append(account_entry)
+    
+    # Batch reductions over the precomputed per-account floats: sum() runs
+    # the accumulation in C instead of one interpreter add per iteration.
+    # At tens of accounts this is the right-sized form of vectorizing the
+    # aggregation; a NumPy dependency is not warranted for it.
+    total_equity = sum(a["equity"] for a in accounts_list)
+    total_unrealized_pnl = sum(a["unrealized_pnl"] for a in accounts_list)
+    total_margin_used = sum(a["margin_used"] for a in accounts_list)
+    total_positions = sum(a["open_positions_count"] for a in accounts_list)
+    total_active_orders = sum(a["active_orders_count"] for a in accounts_list)
+    total_trades = sum(a["trades_count"] for a in accounts_list)
+    
+    accounts_list.sort(key=_account_sort_key)
     
     return {
         "accounts": accounts_list,
@@ -462,50 +735,78 @@ async def get_portfolio():
             "total_positions": total_positions,
             "total_active_orders": total_active_orders,
             "total_trades": total_trades,
-            "accounts_live": len([a for a in accounts_list if a["is_live"]]),
+            "accounts_live": accounts_live,
             "accounts_total": len(settings.accounts)
         },
         "timestamp": int(now)
     }
 
+# Serialized initial-state frames shared by every connecting client
+# until the cache version moves. Chunked per _INITIAL_CHUNK_SIZE keys so
+# a large cache is never encoded or sent as one giant frame
+_INITIAL_CHUNK_SIZE = 16
+_initial_snapshot = {"version": -1, "frames": None}
+
+
+async def _initial_data_frames() -> list:
+    version = cache.version
+    if _initial_snapshot["frames"] is None or _initial_snapshot["version"] != version:
+        cached_data = await cache.get_all()
+        items = list(cached_data.items())
+        frames = [
+            orjson.dumps({
+                "type": "initial_batch",
+                "data": dict(items[i:i + _INITIAL_CHUNK_SIZE])
+            })
+            for i in range(0, len(items), _INITIAL_CHUNK_SIZE)
+        ]
+        frames.append(b'{"type":"initial_done"}')
+        _initial_snapshot["frames"] = frames
+        _initial_snapshot["version"] = version
+    return _initial_snapshot["frames"]
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
-        cached_data = await cache.get_all()
-        await manager.send_to_client(websocket, {
-            "type": "initial_data",
-            "data": cached_data
-        })
+        for frame in await _initial_data_frames():
+            await manager.send_raw_to_client(websocket, frame)
+            # Yield between chunks so a connection storm can't pin the
+            # loop on a single client's initial dump
+            await asyncio.sleep(0)
         
+        # Clients are read-only subscribers: drain inbound frames without
+        # decoding or logging them, waiting only for the disconnect event
         while True:
-            data = await websocket.receive_text()
-            logger.debug(f"Received from client: {data}")
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        await manager.disconnect(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
         await manager.disconnect(websocket)
 
 @app.get("/api/ws/positions")
 @limiter.limit(settings.rate_limit)
 async def get_ws_positions(request: Request):
     """Get all positions from WebSocket cache for all accounts"""
-    cached_data = await cache.get_all()
+    cached_data = await cache.get_by_prefix("ws_positions:")
     result = []
     
     for key, value in cached_data.items():
-        if key.startswith("ws_positions:"):
-            account_id = key.replace("ws_positions:", "")
-            data = value.get("data", value)
-            positions = data.get("positions", [])
-            timestamp = data.get("timestamp", 0)
-            result.append({
-                "account_index": account_id,
-                "positions": positions,
-                "timestamp": timestamp,
-                "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
-            })
+        account_id = key[13:]
+        data = value.get("data", value)
+        positions = data.get("positions", [])
+        timestamp = data.get("timestamp", 0)
+        result.append({
+            "account_index": account_id,
+            "positions": positions,
+            "timestamp": timestamp,
+            "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
+        })
     
     return {"accounts": result, "total_accounts": len(result)}
 
@@ -534,22 +835,21 @@ async def get_ws_positions_by_account(request: Request, account_index: int):
 @limiter.limit(settings.rate_limit)
 async def get_ws_orders(request: Request):
     """Get all orders from WebSocket cache for all accounts"""
-    cached_data = await cache.get_all()
+    cached_data = await cache.get_by_prefix("ws_orders:")
     result = []
     
     for key, value in cached_data.items():
-        if key.startswith("ws_orders:"):
-            account_id = key.replace("ws_orders:", "")
-            data = value.get("data", value)
-            orders = data.get("orders", [])
-            timestamp = data.get("timestamp", 0)
-            result.append({
-                "account_index": account_id,
-                "orders": orders,
-                "orders_count": len(orders),
-                "timestamp": timestamp,
-                "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
-            })
+        account_id = key[10:]
+        data = value.get("data", value)
+        orders = data.get("orders", [])
+        timestamp = data.get("timestamp", 0)
+        result.append({
+            "account_index": account_id,
+            "orders": orders,
+            "orders_count": len(orders),
+            "timestamp": timestamp,
+            "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
+        })
     
     return {"accounts": result, "total_accounts": len(result)}
 
@@ -579,35 +879,34 @@ async def get_ws_orders_by_account(request: Request, account_index: int):
 @limiter.limit(settings.rate_limit)
 async def get_ws_trades(request: Request):
     """Get all trades from WebSocket cache for all accounts"""
-    cached_data = await cache.get_all()
+    cached_data = await cache.get_by_prefix("ws_trades:")
     result = []
     
     for key, value in cached_data.items():
-        if key.startswith("ws_trades:"):
-            account_id = key.replace("ws_trades:", "")
-            data = value.get("data", value)
-            trades_raw = data.get("trades", {})
-            volumes = data.get("volumes", {})
-            timestamp = data.get("timestamp", 0)
+        account_id = key[10:]
+        data = value.get("data", value)
+        trades_raw = data.get("trades", {})
+        volumes = data.get("volumes", {})
+        timestamp = data.get("timestamp", 0)
             
-            if isinstance(trades_raw, dict):
-                trades = trades_raw
-                total_trades = sum(len(t) for t in trades_raw.values() if isinstance(t, list))
-            elif isinstance(trades_raw, list):
-                trades = trades_raw
-                total_trades = len(trades_raw)
-            else:
-                trades = {}
-                total_trades = 0
+        if isinstance(trades_raw, dict):
+            trades = trades_raw
+            total_trades = sum(len(t) for t in trades_raw.values() if isinstance(t, list))
+        elif isinstance(trades_raw, list):
+            trades = trades_raw
+            total_trades = len(trades_raw)
+        else:
+            trades = {}
+            total_trades = 0
             
-            result.append({
-                "account_index": account_id,
-                "trades": trades,
-                "trades_count": total_trades,
-                "volumes": volumes,
-                "timestamp": timestamp,
-                "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
-            })
+        result.append({
+            "account_index": account_id,
+            "trades": trades,
+            "trades_count": total_trades,
+            "volumes": volumes,
+            "timestamp": timestamp,
+            "age_seconds": round(time.time() - timestamp, 2) if timestamp else None
+        })
     
     return {"accounts": result, "total_accounts": len(result)}
 
@@ -864,10 +1163,42 @@ if FRONTEND_DIR.exists():
     app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="static")
 
 
+_INDEX_FILE = FRONTEND_DIR / "index.html"
+# (bytes, etag, gzipped bytes), loaded lazily on the first hit so module
+# import stays free of file IO
+_index_cache = None
+
+
+def _load_index():
+    global _index_cache
+    if _index_cache is None and _INDEX_FILE.exists():
+        body = _INDEX_FILE.read_bytes()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        last_modified = time.strftime(
+            "%a, %d %b %Y %H:%M:%S GMT",
+            time.gmtime(_INDEX_FILE.stat().st_mtime)
+        )
+        headers = {
+            "ETag": etag,
+            "Last-Modified": last_modified,
+            "Cache-Control": "public, max-age=300"
+        }
+        _index_cache = (
+            body, etag, gzip.compress(body, 9),
+            headers, {**headers, "Content-Encoding": "gzip"}
+        )
+    return _index_cache
+
+
 @app.get("/")
-async def serve_frontend():
+async def serve_frontend(request: Request):
     """Serve React frontend"""
-    index_file = FRONTEND_DIR / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file, media_type="text/html")
+    index = _load_index()
+    if index is not None:
+        body, etag, gzipped, headers, gzip_headers = index
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(gzipped, media_type="text/html", headers=gzip_headers)
+        return Response(body, media_type="text/html", headers=headers)
     return HTMLResponse("<h1>Frontend not built. Run: cd mFrontend && npm run build</h1>", status_code=503)
@@ -3,17 +3,39 @@ import time
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
+import orjson
+
 @dataclass
 class CacheEntry:
     data: Any
     timestamp: float
     ttl: int
+    blob: Optional[bytes] = None
 
 class DataCache:
     def __init__(self, default_ttl: int = 5):
         self._cache: Dict[str, CacheEntry] = {}
         self._lock = asyncio.Lock()
         self.default_ttl = default_ttl
+        self._version = 0
+        self._prefix_index: Dict[str, set] = {}
+
+    @staticmethod
+    def _prefix_of(key: str) -> str:
+        return key.split(":", 1)[0] + ":" if ":" in key else ""
+
+    def _drop_key(self, key: str):
+        """Remove a key from the store and its prefix index (lock held)"""
+        del self._cache[key]
+        prefix = self._prefix_of(key)
+        keys = self._prefix_index.get(prefix)
+        if keys is not None:
+            keys.discard(key)
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every write, for cheap invalidation checks"""
+        return self._version
     
     async def get(self, key: str) -> Optional[Any]:
         async with self._lock:
@@ -21,18 +43,74 @@ class DataCache:
             if entry is None:
                 return None
             if time.time() - entry.timestamp > entry.ttl:
-                del self._cache[key]
+                self._drop_key(key)
                 return None
             return entry.data
     
-    async def set(self, key: str, data: Any, ttl: Optional[int] = None):
+    async def get_entry(self, key: str, allow_expired: bool = False) -> Optional[CacheEntry]:
+        """Return the live CacheEntry itself (data plus any serialized blob).
+
+        With allow_expired=True an expired entry is handed back instead
+        of evicted, for stale-while-revalidate readers.
+        """
+        async with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.timestamp > entry.ttl:
+                if allow_expired:
+                    return entry
+                self._drop_key(key)
+                return None
+            return entry
+    
+    async def set(self, key: str, data: Any, ttl: Optional[int] = None, serialize: bool = False):
+        """Store data; with serialize=True also keep the orjson bytes so read
+        paths can serve the entry without re-encoding it per request."""
         async with self._lock:
             self._cache[key] = CacheEntry(
                 data=data,
                 timestamp=time.time(),
-                ttl=ttl or self.default_ttl
+                ttl=ttl or self.default_ttl,
+                blob=orjson.dumps(data) if serialize else None
             )
+            prefix = self._prefix_of(key)
+            if prefix:
+                self._prefix_index.setdefault(prefix, set()).add(key)
+            self._version += 1
     
+    async def touch(self, key: str) -> bool:
+        """Refresh a live key's write time without changing its value.
+
+        Does not bump the version counter, so touching is invisible to
+        version-keyed consumers (snapshots, initial frames).
+        """
+        async with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False
+            entry.timestamp = time.time()
+            return True
+
+    async def mset(self, items: Dict[str, tuple]):
+        """Store several key -> (data, ttl) pairs under one lock acquisition.
+
+        The whole batch counts as a single version bump, so coalesced
+        writes trigger at most one downstream invalidation.
+        """
+        async with self._lock:
+            now = time.time()
+            for key, (data, ttl) in items.items():
+                self._cache[key] = CacheEntry(
+                    data=data,
+                    timestamp=now,
+                    ttl=ttl or self.default_ttl
+                )
+                prefix = self._prefix_of(key)
+                if prefix:
+                    self._prefix_index.setdefault(prefix, set()).add(key)
+            self._version += 1
+
     async def get_all(self) -> Dict[str, Any]:
         async with self._lock:
             current_time = time.time()
@@ -50,13 +128,71 @@ class DataCache:
                     }
             
             for key in expired_keys:
-                del self._cache[key]
+                self._drop_key(key)
+            
+            return result
+    
+    async def mget(self, keys) -> Dict[str, Any]:
+        """Fetch several keys under one lock acquisition.
+
+        Same wrapped shape as get_all(), with absent or expired keys
+        simply missing from the result.
+        """
+        async with self._lock:
+            current_time = time.time()
+            result = {}
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                if current_time - entry.timestamp > entry.ttl:
+                    self._drop_key(key)
+                    continue
+                result[key] = {
+                    "data": entry.data,
+                    "age": current_time - entry.timestamp,
+                    "ttl": entry.ttl
+                }
+            return result
+    
+    async def get_by_prefix(self, prefix: str) -> Dict[str, Any]:
+        """Return live entries for one key namespace (e.g. "account:").
+
+        Same wrapped shape as get_all(), but scans only the keys recorded
+        under the prefix instead of the whole cache.
+        """
+        async with self._lock:
+            keys = self._prefix_index.get(prefix)
+            if not keys:
+                return {}
+            
+            current_time = time.time()
+            result = {}
+            expired_keys = []
+            
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                if current_time - entry.timestamp > entry.ttl:
+                    expired_keys.append(key)
+                else:
+                    result[key] = {
+                        "data": entry.data,
+                        "age": current_time - entry.timestamp,
+                        "ttl": entry.ttl
+                    }
+            
+            for key in expired_keys:
+                self._drop_key(key)
             
             return result
     
     async def clear(self):
         async with self._lock:
             self._cache.clear()
+            self._prefix_index.clear()
+            self._version += 1
     
     async def get_stats(self) -> Dict[str, Any]:
         async with self._lock:
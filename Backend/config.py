@@ -47,6 +47,8 @@ class Settings(BaseModel):
     
     rate_limit: str = "1000/minute"
     
+    cors_origins: List[str] = ["*"]
+    
     accounts: List[AccountConfig] = []
     
     mode: BroadcasterMode = BroadcasterMode.COLLECTOR
@@ -131,6 +133,7 @@ def get_settings() -> Settings:
         poll_interval=float(os.getenv("POLL_INTERVAL", "0.5")),
         cache_ttl=int(os.getenv("CACHE_TTL", "5")),
         rate_limit=os.getenv("RATE_LIMIT", "1000/minute"),
+        cors_origins=[o.strip() for o in os.getenv("CORS_ORIGINS", "*").split(",") if o.strip()],
         accounts=accounts,
         mode=mode,
         remote_api_base=os.getenv("REMOTE_API_BASE")
@@ -1,12 +1,23 @@
 import time
+from bisect import bisect_left
 from typing import Dict, List, Any
 from collections import deque
 from dataclasses import dataclass, field
 
+MAX_SAMPLES = 30
+
+# Upper bounds (ms) of the fixed histogram buckets used for percentile
+# estimates; the last bucket catches everything slower
+BUCKET_BOUNDS = (1, 3, 6, 10, 30, 100, 300, 1000, 3000, float("inf"))
+
+
 @dataclass
 class LatencyMetrics:
-    samples: deque = field(default_factory=lambda: deque(maxlen=30))
+    samples: deque = field(default_factory=lambda: deque(maxlen=MAX_SAMPLES))
     last_timestamp: float = 0
+    _sum: float = 0
+    _buckets: List[int] = field(default_factory=lambda: [0] * len(BUCKET_BOUNDS))
+    _total: int = 0
     
     @property
     def min(self) -> float:
@@ -24,16 +35,40 @@ class LatencyMetrics:
     def avg(self) -> float:
         if not self.samples:
             return 0
-        return sum(self.samples) / len(self.samples)
+        return self._sum / len(self.samples)
     
     @property
     def count(self) -> int:
         return len(self.samples)
     
     def add_sample(self, latency_ms: float):
+        # Keep a running sum so avg is O(1) instead of rescanning the
+        # window on every metrics read
+        if len(self.samples) == self.samples.maxlen:
+            self._sum -= self.samples[0]
+        self._sum += latency_ms
         self.samples.append(latency_ms)
+        self._buckets[bisect_left(BUCKET_BOUNDS, latency_ms)] += 1
+        self._total += 1
         self.last_timestamp = time.time()
     
+    def percentile(self, pct: float) -> float:
+        """Estimate a percentile from the bucket histogram.
+
+        Reports the upper bound of the bucket the percentile falls in —
+        fixed memory and O(buckets) regardless of how many samples were
+        ever recorded.
+        """
+        if self._total == 0:
+            return 0
+        threshold = self._total * pct / 100
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS, self._buckets):
+            cumulative += count
+            if cumulative >= threshold:
+                return bound if bound != BUCKET_BOUNDS[-1] else BUCKET_BOUNDS[-2]
+        return BUCKET_BOUNDS[-2]
+    
     def get_samples_list(self) -> List[float]:
         return list(self.samples)
 
@@ -123,7 +158,9 @@ class LatencyTracker:
                 "interval_min": round(self.ws_messages.min, 0),
                 "interval_avg": round(self.ws_messages.avg, 0),
                 "interval_max": round(self.ws_messages.max, 0),
-                "samples": self.ws_messages.get_samples_list()
+                "p50": self.ws_messages.percentile(50),
+                "p95": self.ws_messages.percentile(95),
+                "p99": self.ws_messages.percentile(99)
             },
             "rest": {
                 "request_count": self.rest_request_count,
@@ -131,7 +168,9 @@ class LatencyTracker:
                 "interval_min": round(self.rest_polling.min, 0),
                 "interval_avg": round(self.rest_polling.avg, 0),
                 "interval_max": round(self.rest_polling.max, 0),
-                "samples": self.rest_polling.get_samples_list()
+                "p50": self.rest_polling.percentile(50),
+                "p95": self.rest_polling.percentile(95),
+                "p99": self.rest_polling.percentile(99)
             },
             "timestamps": {
                 "ws": round(self.last_ws_update, 0) if self.last_ws_update else None,
@@ -1,14 +1,17 @@
 import asyncio
+import hashlib
 import logging
 import time
 from collections import deque
 from typing import Dict, Any, Optional, List, Union
 import aiohttp
 import lighter
+import orjson
 from lighter.configuration import Configuration
 from Backend.config import AccountConfig, settings
 from Backend.cache import cache
 from Backend.latency import latency_tracker
+from Backend.websocket_client import ws_client
 from Backend.supabase_client import supabase_client
 from Backend.error_collector import error_collector
 
@@ -23,6 +26,197 @@ RETRY_PHASE_1_MAX_ATTEMPTS = 5
 RETRY_PHASE_2_INTERVAL = 300
 REQUEST_TIMEOUT = 30
 
+POLL_INTERVAL_MAX = 60
+POLL_BACKOFF_FACTOR = 2.0
+POLL_RECOVER_STEP = 0.5
+RATE_HEADROOM = 0.1
+FETCH_CONCURRENCY = 8
+WS_RECONCILE_INTERVAL = 10.0
+# Liveness markers need headroom over the slowest healthy write cadence
+# (the reconcile interval plus fetch time); matching it exactly made the
+# marker expire right before each cycle's refresh
+ACCOUNT_LIVE_TTL = int(2.5 * WS_RECONCILE_INTERVAL)
+UPSTREAM_RATE = 20.0
+UPSTREAM_BURST = 20.0
+SERIALIZE_OFFLOAD_BYTES = 65536
+
+class _TokenBucket:
+    """Minimal async token bucket for pacing upstream requests.
+
+    Tokens refill continuously at `rate` per second up to `burst`;
+    callers take one per request and sleep off any deficit. Bounds
+    sustained QPS without imposing a fixed inter-request gap.
+    """
+
+    __slots__ = ("rate", "burst", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _f(x) -> float:
+    """float() with a fast path for values that are already numeric.
+
+    The upstream API mixes floats, ints, numeric strings, and None for
+    the same fields; type-dispatching here skips the float() call (and
+    its string parse) for the common already-numeric case.
+    """
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        return float(x)
+    if not x:
+        return 0.0
+    return float(x)
+
+
+class _RollingVolume:
+    """Rolling 24h notional volume, maintained incrementally at write time.
+
+    New trades are added once (deduplicated by trade id) and expired ones
+    are evicted from the left of the window, so the total stays a running
+    sum instead of an O(trades) rescan on every poll.
+    """
+
+    __slots__ = ("_window", "_seen", "total")
+
+    def __init__(self):
+        self._window: deque = deque()
+        self._seen: set = set()
+        self.total: float = 0.0
+
+    def update(self, trades: List[Dict[str, Any]], now: float) -> float:
+        day_ago = now - 86400
+
+        window = self._window
+        seen = self._seen
+        while window and window[0][0] < day_ago:
+            _, key, notional = window.popleft()
+            seen.discard(key)
+            self.total -= notional
+
+        if not trades:
+            return self.total
+
+        total = self.total
+        for trade in trades:
+            key = trade.get("trade_id")
+            if key is None:
+                key = (trade.get("timestamp"), trade.get("size"), trade.get("price"))
+            if key in seen:
+                continue
+            trade_ts = _f(trade.get("timestamp", 0))
+            trade_time = trade_ts / 1000 if trade_ts > 10000000000 else trade_ts
+            if trade_time < day_ago:
+                continue
+            notional = abs(_f(trade.get("size", 0))) * _f(trade.get("price", 0))
+            window.append((trade_time, key, notional))
+            seen.add(key)
+            total += notional
+        self.total = total
+
+        return total
+
+
+_volume_windows: Dict[int, _RollingVolume] = {}
+
+# SignerClients keyed by (account_index, api_key_index, key fingerprint):
+# construction parses keys and sets up crypto state, so re-initializing
+# with unchanged credentials reuses the existing client
+_signer_pool: Dict[tuple, Any] = {}
+
+
+def summarize_account_data(serialized_data: Any, now: Optional[float] = None,
+                           account_index: Optional[int] = None) -> Dict[str, Any]:
+    """Precompute the per-account aggregates that /api/portfolio needs.
+
+    Runs once at cache-write time so the endpoint only reads plain floats
+    instead of re-parsing raw_data on every request. When account_index is
+    given, 24h volume comes from that account's rolling window instead of
+    a full trade scan.
+    """
+    if now is None:
+        now = time.time()
+
+    summary = {
+        "equity": 0.0,
+        "available_balance": 0.0,
+        "unrealized_pnl": 0.0,
+        "margin_used": 0.0,
+        "margin_ratio": 0.0,
+        "volume_24h": 0.0,
+        "positions": [],
+        "trades": []
+    }
+
+    if not isinstance(serialized_data, dict):
+        return summary
+
+    acc_list = serialized_data.get("accounts", [])
+    if acc_list:
+        acc = acc_list[0]
+        equity = _f(acc.get("collateral", 0))
+        available_balance = _f(acc.get("available_balance", 0))
+        margin_used = equity - available_balance
+
+        unrealized_pnl = 0.0
+        positions = []
+        for pos in acc.get("positions", []):
+            # Coerce the hot numeric fields once at ingest so later
+            # consumers read plain floats instead of re-parsing strings
+            pnl = pos["unrealized_pnl"] = _f(pos.get("unrealized_pnl", 0))
+            size = pos["position"] = _f(pos.get("position", 0))
+            unrealized_pnl += pnl
+            if size != 0:
+                positions.append(pos)
+
+        summary["equity"] = equity
+        summary["available_balance"] = available_balance
+        summary["margin_used"] = margin_used
+        summary["unrealized_pnl"] = unrealized_pnl
+        summary["positions"] = positions
+        if equity > 0:
+            summary["margin_ratio"] = margin_used / equity
+
+    trades = serialized_data.get("trades", []) or []
+    summary["trades"] = trades
+
+    if account_index is not None:
+        window = _volume_windows.get(account_index)
+        if window is None:
+            window = _volume_windows[account_index] = _RollingVolume()
+        summary["volume_24h"] = window.update(trades, now)
+    else:
+        # One-shot scan for callers without a stable account identity
+        day_ago = now - 86400
+        volume_24h = 0.0
+        for trade in trades:
+            trade_ts = _f(trade.get("timestamp", 0))
+            trade_time = trade_ts / 1000 if trade_ts > 10000000000 else trade_ts
+            if trade_time >= day_ago:
+                size = abs(_f(trade.get("size", 0)))
+                price = _f(trade.get("price", 0))
+                volume_24h += size * price
+        summary["volume_24h"] = volume_24h
+
+    return summary
+
+
 class AccountRestConnection:
     """Tracks REST API connection state and retry logic for a single account"""
     
@@ -140,18 +334,24 @@ class LighterClient:
         self.last_orders_update: Dict[int, float] = {}
         self._cached_orders: Dict[int, List[Dict[str, Any]]] = {}
         self._last_snapshot_times: Dict[int, float] = {}
-        self._account_exchanges: Dict[str, str] = {}
+        self._account_exchanges: Dict[str, str] = {
+            account.name: account.exchange for account in settings.accounts
+        }
         self._rest_connections: Dict[int, AccountRestConnection] = {}
         self._start_time: float = 0
+        self._poll_interval: float = 0
+        self._rate_pressure: bool = False
+        self._rate_limited_until: float = 0
+        self._fetch_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+        self._payload_hashes: Dict[int, bytes] = {}
+        self._inflight: Dict[int, asyncio.Future] = {}
+        self._request_bucket = _TokenBucket(UPSTREAM_RATE, UPSTREAM_BURST)
+        self._blob_sizes: Dict[int, int] = {}
+        self._last_summaries: Dict[int, Dict[str, Any]] = {}
         self._pause_event.set()
     
     def _get_exchange_for_account(self, account_name: str) -> str:
-        if account_name in self._account_exchanges:
-            return self._account_exchanges[account_name]
-        for account in settings.accounts:
-            if account.name == account_name:
-                return account.exchange
-        return "lighter"
+        return self._account_exchanges.get(account_name, "lighter")
     
     async def _get_http_session_for_account(self, account_name: str) -> aiohttp.ClientSession:
         if account_name not in self._http_sessions or self._http_sessions[account_name].closed:
@@ -177,6 +377,23 @@ class LighterClient:
             logger.error(f"Failed to create auth token for {account_name}: {e}")
             return None
     
+    def _note_rate_headers(self, headers, status: int = 200):
+        """Feed upstream rate-limit headers into the adaptive poll interval"""
+        try:
+            if status == 429:
+                retry_after = float(headers.get("Retry-After", 0) or 0)
+                if retry_after > 0:
+                    self._rate_limited_until = time.time() + retry_after
+                self._rate_pressure = True
+                return
+            remaining = headers.get("x-ratelimit-remaining")
+            limit = headers.get("x-ratelimit-limit")
+            if remaining is not None and limit is not None:
+                if float(remaining) < RATE_HEADROOM * float(limit):
+                    self._rate_pressure = True
+        except (TypeError, ValueError):
+            pass
+    
     def _get_rest_connection(self, account_name: str, account_index: int) -> AccountRestConnection:
         """Get or create REST connection tracker for account"""
         if account_index not in self._rest_connections:
@@ -203,6 +420,7 @@ class LighterClient:
             proxy = self._account_proxies.get(account_name)
             
             async with session.get(url, params=params, headers=headers, proxy=proxy) as resp:
+                self._note_rate_headers(resp.headers, resp.status)
                 if resp.status == 200:
                     data = await resp.json()
                     orders = data.get("orders", [])
@@ -258,32 +476,55 @@ class LighterClient:
     
     async def initialize(self, accounts: List[AccountConfig]):
         self._start_time = time.time()
+        shared_api_client = None
+        shared_account_api = None
         for account in accounts:
             try:
-                config = Configuration()
-                config.host = settings.lighter_base_url
-                
                 self._account_proxies[account.name] = account.proxy_url
                 
                 if account.proxy_url:
+                    # Proxied accounts need their own client so requests
+                    # egress through the right address
+                    config = Configuration()
+                    config.host = settings.lighter_base_url
                     config.proxy = account.proxy_url
                     logger.info(f"Using proxy for {account.name}: {account.proxy_url[:40]}...")
+                    api_client = lighter.ApiClient(configuration=config)
+                    account_api = lighter.AccountApi(api_client)
+                else:
+                    # Unproxied accounts all talk to the same host; share
+                    # one client so they reuse a single connection pool
+                    # instead of opening per-account TLS sessions
+                    if shared_api_client is None:
+                        config = Configuration()
+                        config.host = settings.lighter_base_url
+                        shared_api_client = lighter.ApiClient(configuration=config)
+                        shared_account_api = lighter.AccountApi(shared_api_client)
+                    api_client = shared_api_client
+                    account_api = shared_account_api
                 
-                api_client = lighter.ApiClient(configuration=config)
                 self.api_clients[account.name] = api_client
-                self.account_apis[account.name] = lighter.AccountApi(api_client)
+                self.account_apis[account.name] = account_api
                 
                 if account.private_key:
-                    api_private_keys = {account.api_key_index: account.private_key}
-                    signer = lighter.SignerClient(
-                        url=settings.lighter_base_url,
-                        account_index=account.account_index,
-                        api_private_keys=api_private_keys
+                    signer_key = (
+                        account.account_index,
+                        account.api_key_index,
+                        hashlib.blake2b(account.private_key.encode(), digest_size=16).digest()
                     )
-                    if account.proxy_url:
-                        signer.api_client.configuration.proxy = account.proxy_url
-                        if hasattr(signer.api_client, 'rest_client'):
-                            signer.api_client.rest_client.proxy = account.proxy_url
+                    signer = _signer_pool.get(signer_key)
+                    if signer is None:
+                        api_private_keys = {account.api_key_index: account.private_key}
+                        signer = lighter.SignerClient(
+                            url=settings.lighter_base_url,
+                            account_index=account.account_index,
+                            api_private_keys=api_private_keys
+                        )
+                        if account.proxy_url:
+                            signer.api_client.configuration.proxy = account.proxy_url
+                            if hasattr(signer.api_client, 'rest_client'):
+                                signer.api_client.rest_client.proxy = account.proxy_url
+                        _signer_pool[signer_key] = signer
                     self.signer_clients[account.name] = signer
                 
                 self._rest_connections[account.account_index] = AccountRestConnection(account.name, account.account_index)
@@ -292,19 +533,56 @@ class LighterClient:
             except Exception as e:
                 logger.error(f"Failed to initialize client for {account.name}: {e}")
     
+    @staticmethod
+    def _serialize_default(obj: Any) -> Any:
+        """orjson fallback for SDK model objects it can't encode natively"""
+        to_dict = getattr(obj, "to_dict", None)
+        if to_dict is not None:
+            return to_dict()
+        attrs = getattr(obj, "__dict__", None)
+        if attrs is not None:
+            return {k: v for k, v in attrs.items() if k[0] != '_'}
+        return str(obj)
+    
+    def _serialize_account_blob(self, account_data: Any) -> bytes:
+        """Encode an SDK response to JSON bytes in one C-level pass.
+
+        orjson walks the tree itself and only calls back into Python
+        (via _serialize_default) for model objects, replacing the old
+        per-node recursive Python serializer.
+        """
+        return orjson.dumps(
+            account_data,
+            default=self._serialize_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+    
     def _serialize_account_data(self, account_data: Any) -> Union[Dict[str, Any], List[Any], Any]:
-        if hasattr(account_data, 'to_dict'):
-            return account_data.to_dict()
-        elif hasattr(account_data, '__dict__'):
-            return {k: self._serialize_account_data(v) for k, v in account_data.__dict__.items() if not k.startswith('_')}
-        elif isinstance(account_data, list):
-            return [self._serialize_account_data(item) for item in account_data]
-        elif isinstance(account_data, dict):
-            return {k: self._serialize_account_data(v) for k, v in account_data.items()}
-        else:
-            return account_data
+        return orjson.loads(self._serialize_account_blob(account_data))
     
     async def fetch_account_data(self, account_name: str, account_index: int) -> Optional[Dict[str, Any]]:
+        """Single-flight wrapper around the real fetch.
+
+        The poll cycle, the stale-while-revalidate path, and on-demand
+        endpoint hits can all ask for the same account concurrently;
+        callers arriving while a fetch is in flight await its result
+        instead of issuing a duplicate upstream request.
+        """
+        fut = self._inflight.get(account_index)
+        if fut is not None:
+            return await fut
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[account_index] = fut
+        data = None
+        try:
+            data = await self._fetch_account_data(account_name, account_index)
+            return data
+        finally:
+            del self._inflight[account_index]
+            if not fut.done():
+                fut.set_result(data)
+    
+    async def _fetch_account_data(self, account_name: str, account_index: int) -> Optional[Dict[str, Any]]:
         rest_conn = self._get_rest_connection(account_name, account_index)
         
         if rest_conn.should_skip_request():
@@ -317,6 +595,7 @@ class LighterClient:
             if not account_api:
                 return None
             
+            await self._request_bucket.acquire()
             start_time = time.time()
             account_data = await account_api.account(by="index", value=str(account_index))
             latency_ms = (time.time() - start_time) * 1000
@@ -324,7 +603,15 @@ class LighterClient:
             
             rest_conn.record_success()
             
-            serialized_data = self._serialize_account_data(account_data)
+            if self._blob_sizes.get(account_index, 0) > SERIALIZE_OFFLOAD_BYTES:
+                # Accounts that serialized large last poll get encoded off
+                # the event loop so WS heartbeats and other clients aren't
+                # stalled behind a multi-ms dumps
+                raw_blob = await asyncio.to_thread(self._serialize_account_blob, account_data)
+            else:
+                raw_blob = self._serialize_account_blob(account_data)
+            self._blob_sizes[account_index] = len(raw_blob)
+            serialized_data = orjson.loads(raw_blob)
             
             active_orders = self._cached_orders.get(account_index, [])
             
@@ -334,15 +621,48 @@ class LighterClient:
             latency_tracker.update_balance_time()
             latency_tracker.update_positions_time()
             
+            # Between fills the upstream payload is usually byte-identical
+            # poll to poll; reuse the previous summary instead of re-walking
+            # positions and trades when nothing changed
+            hasher = hashlib.blake2b(raw_blob, digest_size=8)
+            hasher.update(orjson.dumps(active_orders))
+            digest = hasher.digest()
+            unchanged = self._payload_hashes.get(account_index) == digest
+            summary = self._last_summaries.get(account_index)
+            if summary is None or not unchanged:
+                summary = summarize_account_data(serialized_data, current_time, account_index)
+                self._payload_hashes[account_index] = digest
+                self._last_summaries[account_index] = summary
+            else:
+                # Still age out expired window entries so 24h volume decays
+                window = _volume_windows.get(account_index)
+                if window is not None:
+                    summary["volume_24h"] = window.update((), current_time)
+            
             data = {
                 "account_index": account_index,
                 "account_name": account_name,
                 "raw_data": serialized_data,
                 "active_orders": active_orders,
+                "portfolio_summary": summary,
                 "last_update": current_time
             }
             
-            await cache.set(f"account:{account_index}", data)
+            # TTL must outlive the write cadence: with WS push healthy the
+            # poller only reconciles every WS_RECONCILE_INTERVAL, and the
+            # adaptive backoff can stretch _poll_interval past the cache
+            # default, either of which would expire entries between writes
+            entry_ttl = int(max(
+                settings.cache_ttl,
+                2 * max(WS_RECONCILE_INTERVAL, self._poll_interval)
+            ))
+            if not (unchanged and await cache.touch(f"account:{account_index}")):
+                await cache.set(f"account:{account_index}", data, serialize=True, ttl=entry_ttl)
+            # Liveness marker: readers check this key's existence instead
+            # of digging last_update out of the account entry. Touch first
+            # so refreshing it doesn't invalidate version-keyed snapshots.
+            if not await cache.touch(f"account_live:{account_index}"):
+                await cache.set(f"account_live:{account_index}", True, ttl=ACCOUNT_LIVE_TTL)
             
             last_snapshot = self._last_snapshot_times.get(account_index, 0)
             if supabase_client.is_initialized and (current_time - last_snapshot) >= SNAPSHOT_INTERVAL:
@@ -374,14 +694,36 @@ class LighterClient:
             error_msg = str(e)
             error_type = "429" if "429" in error_msg else "exception"
             error_code = 429 if "429" in error_msg else None
+            if error_code == 429:
+                self._rate_pressure = True
             error_collector.add_error(account_index, account_name, error_type, error_msg[:100], "rest", error_code)
             logger.error(f"Error fetching account {account_index}: {e}")
             return None
     
+    async def warmup_pool(self):
+        """Open a keep-alive connection per account so the first real
+        request after startup doesn't pay TCP/TLS handshake cost."""
+        async def warm(account: AccountConfig):
+            try:
+                session = await self._get_http_session_for_account(account.name)
+                proxy = self._account_proxies.get(account.name)
+                async with session.get(settings.lighter_base_url, proxy=proxy) as resp:
+                    await resp.read()
+                logger.debug("[%s] Warmed connection (HTTP %s)", account.name, resp.status)
+            except Exception as e:
+                logger.debug("[%s] Connection warmup failed: %s", account.name, e)
+        
+        await asyncio.gather(*(warm(account) for account in settings.accounts))
+    
     async def fetch_all_accounts(self) -> Dict[str, Any]:
-        """Fetch all accounts in parallel using asyncio.gather"""
+        """Fetch all accounts in parallel using asyncio.gather.
+
+        Bounded by a semaphore so a large account list doesn't open one
+        upstream request per account at once and trip rate limits.
+        """
         async def fetch_single(account):
-            return await self.fetch_account_data(account.name, account.account_index)
+            async with self._fetch_semaphore:
+                return await self.fetch_account_data(account.name, account.account_index)
         
         tasks = [fetch_single(account) for account in settings.accounts]
         results_list = await asyncio.gather(*tasks, return_exceptions=True)
@@ -414,6 +756,7 @@ class LighterClient:
     
     async def start_polling(self):
         self.running = True
+        self._poll_interval = float(settings.poll_interval)
         logger.info(f"Starting account polling with interval: {settings.poll_interval}s")
         
         while self.running:
@@ -421,8 +764,25 @@ class LighterClient:
                 await self._pause_event.wait()
                 if not self.running:
                     break
+                wait = self._rate_limited_until - time.time()
+                if wait > 0:
+                    logger.warning("Rate limited upstream, pausing polling for %.1fs", wait)
+                    await asyncio.sleep(wait)
                 await self.fetch_all_accounts()
-                await asyncio.sleep(settings.poll_interval)
+                if self._rate_pressure:
+                    # Multiplicative backoff while upstream headroom is low
+                    self._poll_interval = min(self._poll_interval * POLL_BACKOFF_FACTOR, POLL_INTERVAL_MAX)
+                    self._rate_pressure = False
+                    logger.info("Backing off poll interval to %.1fs", self._poll_interval)
+                elif self._poll_interval > settings.poll_interval:
+                    # Additive recovery once pressure clears
+                    self._poll_interval = max(self._poll_interval - POLL_RECOVER_STEP, settings.poll_interval)
+                sleep_for = self._poll_interval
+                if sleep_for < WS_RECONCILE_INTERVAL and ws_client.is_connected:
+                    # The WS streams push account changes as they happen;
+                    # while they're up, REST only reconciles drift
+                    sleep_for = WS_RECONCILE_INTERVAL
+                await asyncio.sleep(sleep_for)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -464,7 +824,8 @@ class LighterClient:
             if session and not session.closed:
                 await session.close()
         self._http_sessions.clear()
-        for client in self.api_clients.values():
+        # Dedupe by identity: unproxied accounts share one client
+        for client in {id(c): c for c in self.api_clients.values()}.values():
             try:
                 if hasattr(client, 'close'):
                     result = client.close()
@@ -504,7 +865,7 @@ class LighterClient:
             "success_rate": round((total_requests - total_failures) / total_requests * 100, 1) if total_requests > 0 else 100,
             "uptime_seconds": round(uptime, 1),
             "polling": self.running,
-            "poll_interval": settings.poll_interval,
+            "poll_interval": round(self._poll_interval, 1) if self._poll_interval else settings.poll_interval,
             "connections": connections_health
         }
     
@@ -1,10 +1,11 @@
 import asyncio
 import logging
-import json
+import random
 import time
 from collections import deque
 from typing import Optional, Callable, List, Any, Dict
 import aiohttp
+import orjson
 from aiohttp_socks import ProxyConnector
 import lighter
 from Backend.config import settings, AccountConfig
@@ -18,23 +19,33 @@ PING_INTERVAL = 30
 PONG_TIMEOUT = 60
 HEALTH_CHECK_INTERVAL = 10
 
+CONNECTED_CACHE_TTL = 1.0
+
 RETRY_PHASE_1_INTERVAL = 60
 RETRY_PHASE_1_MAX_ATTEMPTS = 5
 RETRY_PHASE_2_INTERVAL = 300
 
+_WS_HEADERS_BASE = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Origin": "https://lighter.xyz"
+}
+
 class AccountWebSocketConnection:
     """Single WebSocket connection for one account through its proxy"""
     
     def __init__(self, account: AccountConfig, signer: Optional[lighter.SignerClient] = None):
         self.account = account
         self.signer = signer
+        self._log_prefix = f"[{account.name}]"
         self.running = False
         self._ws = None
         self._session = None
         self._connected = False
         self._callbacks: List[Callable] = []
+        self._sync_callbacks: List[Callable] = []
+        self._async_callbacks: List[Callable] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._task: Optional[asyncio.Task] = None
-        self._ping_task: Optional[asyncio.Task] = None
         self._last_pong_time: float = 0
         self._last_message_time: float = 0
         self._reconnect_count: int = 0
@@ -48,16 +59,40 @@ class AccountWebSocketConnection:
     def add_callback(self, callback: Callable):
         if callback not in self._callbacks:
             self._callbacks.append(callback)
-    
-    async def _notify_callbacks(self, data: Any):
-        for callback in self._callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(data)
-                else:
-                    callback(data)
-            except Exception as e:
-                logger.error(f"Callback error for account {self.account.account_index}: {e}")
+            # Classify once here so the receive loop doesn't pay
+            # iscoroutinefunction per message
+            if asyncio.iscoroutinefunction(callback):
+                self._async_callbacks.append(callback)
+            else:
+                self._sync_callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+        if callback in self._sync_callbacks:
+            self._sync_callbacks.remove(callback)
+        if callback in self._async_callbacks:
+            self._async_callbacks.remove(callback)
+
+    def _run_sync_callback(self, callback: Callable, data: Any):
+        try:
+            callback(data)
+        except Exception as e:
+            logger.error("Callback error for account %s: %s", self.account.account_index, e)
+
+    async def _run_async_callback(self, callback: Callable, data: Any):
+        try:
+            await callback(data)
+        except Exception as e:
+            logger.error("Callback error for account %s: %s", self.account.account_index, e)
+
+    def _dispatch(self, data: Any):
+        """Schedule callbacks without suspending the receive loop"""
+        loop = self._loop
+        for callback in self._sync_callbacks:
+            loop.call_soon(self._run_sync_callback, callback, data)
+        for callback in self._async_callbacks:
+            loop.create_task(self._run_async_callback(callback, data))
     
     def _generate_auth_token(self) -> Optional[str]:
         if not self.signer:
@@ -74,39 +109,35 @@ class AccountWebSocketConnection:
             logger.error(f"Failed to generate auth token for {self.account.name}: {e}")
             return None
     
-    async def _ping_loop(self):
-        """Send ping every PING_INTERVAL seconds and check for pong timeout"""
-        while self.running and self._connected:
-            try:
-                await asyncio.sleep(PING_INTERVAL)
-                
-                if not self._ws or self._ws.closed:
-                    logger.warning(f"[{self.account.name}] Ping: WS closed, triggering reconnect")
-                    self._connected = False
-                    break
-                
-                time_since_last_activity = time.time() - max(self._last_pong_time, self._last_message_time)
-                if time_since_last_activity > PONG_TIMEOUT:
-                    logger.warning(f"[{self.account.name}] No activity for {time_since_last_activity:.0f}s, triggering reconnect")
-                    self._connected = False
-                    if self._ws and not self._ws.closed:
-                        await self._ws.close()
-                    break
-                
-                await self._ws.ping()
-                logger.debug(f"[{self.account.name}] Ping sent")
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.warning(f"[{self.account.name}] Ping error: {e}")
+    async def check_ping(self):
+        """Send ping and check for pong timeout (driven by the shared supervisor)"""
+        if not self.running or not self._connected:
+            return
+        try:
+            if not self._ws or self._ws.closed:
+                logger.warning("%s Ping: WS closed, triggering reconnect", self._log_prefix)
                 self._connected = False
-                break
+                return
+
+            time_since_last_activity = time.time() - max(self._last_pong_time, self._last_message_time)
+            if time_since_last_activity > PONG_TIMEOUT:
+                logger.warning("%s No activity for %.0fs, triggering reconnect", self._log_prefix, time_since_last_activity)
+                self._connected = False
+                if self._ws and not self._ws.closed:
+                    await self._ws.close()
+                return
+
+            await self._ws.ping()
+            logger.debug("%s Ping sent", self._log_prefix)
+
+        except Exception as e:
+            logger.warning("%s Ping error: %s", self._log_prefix, e)
+            self._connected = False
     
     def _handle_pong(self):
         """Called when pong is received"""
         self._last_pong_time = time.time()
-        logger.debug(f"[{self.account.name}] Pong received")
+        logger.debug("%s Pong received", self._log_prefix)
     
     def _get_retry_interval(self) -> float:
         """Calculate retry interval based on current phase"""
@@ -121,16 +152,17 @@ class AccountWebSocketConnection:
         if self._retry_phase == 1 and self._phase_attempts >= RETRY_PHASE_1_MAX_ATTEMPTS:
             self._retry_phase = 2
             self._phase_attempts = 0
-            logger.info(f"[{self.account.name}] Switching to phase 2 retry (every {RETRY_PHASE_2_INTERVAL}s)")
+            logger.info("%s Switching to phase 2 retry (every %ds)", self._log_prefix, RETRY_PHASE_2_INTERVAL)
     
     def _reset_retry_state(self):
         """Reset retry state after successful connection"""
         self._retry_phase = 1
         self._phase_attempts = 0
     
-    def get_health_status(self) -> Dict[str, Any]:
+    def get_health_status(self, now: Optional[float] = None) -> Dict[str, Any]:
         """Return health status of this connection"""
-        now = time.time()
+        if now is None:
+            now = time.time()
         uptime = now - self._connection_start_time if self._connected and self._connection_start_time > 0 else 0
         return {
             "account_id": self.account.account_index,
@@ -167,25 +199,24 @@ class AccountWebSocketConnection:
     async def connect(self):
         account_id = self.account.account_index
         proxy_url = self.account.proxy_url
-        
+        self._loop = asyncio.get_running_loop()
+
         while self.running:
             try:
                 ws_url = settings.lighter_ws_url
                 auth_token = self._generate_auth_token()
                 
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Origin": "https://lighter.xyz"
-                }
                 if auth_token:
-                    headers["Authorization"] = f"Bearer {auth_token}"
+                    headers = {**_WS_HEADERS_BASE, "Authorization": f"Bearer {auth_token}"}
+                else:
+                    headers = _WS_HEADERS_BASE
                 
                 if proxy_url:
-                    logger.info(f"[{self.account.name}] Connecting WS via proxy: {proxy_url[:30]}...")
+                    logger.info("%s Connecting WS via proxy: %s...", self._log_prefix, proxy_url[:30])
                     connector = ProxyConnector.from_url(proxy_url)
                     self._session = aiohttp.ClientSession(connector=connector)
                 else:
-                    logger.info(f"[{self.account.name}] Connecting WS directly (no proxy)")
+                    logger.info("%s Connecting WS directly (no proxy)", self._log_prefix)
                     self._session = aiohttp.ClientSession()
                 
                 async with self._session.ws_connect(
@@ -200,13 +231,11 @@ class AccountWebSocketConnection:
                     self._connection_start_time = time.time()
                     self._last_successful_connect = time.time()
                     self._reset_retry_state()
-                    logger.info(f"[{self.account.name}] WebSocket connected! (reconnects: {self._reconnect_count})")
-                    
-                    self._ping_task = asyncio.create_task(self._ping_loop())
-                    
+                    logger.info("%s WebSocket connected! (reconnects: %d)", self._log_prefix, self._reconnect_count)
+
                     auth_token = self._generate_auth_token()
                     if not auth_token:
-                        logger.warning(f"[{self.account.name}] No auth token, skipping subscriptions")
+                        logger.warning("%s No auth token, skipping subscriptions", self._log_prefix)
                     else:
                         subscriptions = [
                             {"type": "subscribe", "channel": f"account_all_positions/{account_id}", "auth": auth_token},
@@ -215,14 +244,14 @@ class AccountWebSocketConnection:
                         ]
                         for sub in subscriptions:
                             await ws.send_json(sub)
-                        logger.info(f"[{self.account.name}] Subscribed to positions, orders, trades")
+                        logger.info("%s Subscribed to positions, orders, trades", self._log_prefix)
                     
                     async for msg in ws:
                         if msg.type == aiohttp.WSMsgType.TEXT:
                             self._last_message_time = time.time()
                             self._total_messages += 1
                             try:
-                                data = json.loads(msg.data)
+                                data = orjson.loads(msg.data)
                                 self._raw_messages.append({
                                     "timestamp": time.time(),
                                     "account_index": self.account.account_index,
@@ -235,28 +264,22 @@ class AccountWebSocketConnection:
                                     orders_count = len(data.get("orders", []))
                                     positions_count = len(data.get("positions", []))
                                     trades_count = len(data.get("trades", {}))
-                                    logger.debug(f"[{self.account.name}] WS [{msg_type}] {channel} - orders:{orders_count} pos:{positions_count} trades:{trades_count}")
-                                await self._notify_callbacks(data)
-                            except json.JSONDecodeError:
-                                logger.warning(f"[{self.account.name}] Invalid JSON from WS")
+                                    logger.debug("%s WS [%s] %s - orders:%d pos:%d trades:%d", self._log_prefix, msg_type, channel, orders_count, positions_count, trades_count)
+                                if self._callbacks:
+                                    self._dispatch(data)
+                            except orjson.JSONDecodeError:
+                                logger.warning("%s Invalid JSON from WS", self._log_prefix)
                             except Exception as e:
-                                logger.error(f"[{self.account.name}] Error processing WS message: {e}")
+                                logger.error("%s Error processing WS message: %s", self._log_prefix, e)
                         elif msg.type == aiohttp.WSMsgType.PONG:
                             self._handle_pong()
                         elif msg.type == aiohttp.WSMsgType.ERROR:
-                            logger.error(f"[{self.account.name}] WebSocket error: {ws.exception()}")
+                            logger.error("%s WebSocket error: %s", self._log_prefix, ws.exception())
                             break
                         elif msg.type == aiohttp.WSMsgType.CLOSED:
-                            logger.warning(f"[{self.account.name}] WebSocket closed by server")
+                            logger.warning("%s WebSocket closed by server", self._log_prefix)
                             break
-                    
-                    if self._ping_task:
-                        self._ping_task.cancel()
-                        try:
-                            await self._ping_task
-                        except asyncio.CancelledError:
-                            pass
-                
+
             except aiohttp.ClientError as e:
                 self._reconnect_count += 1
                 self._advance_retry_phase()
@@ -264,7 +287,7 @@ class AccountWebSocketConnection:
                 error_type = "429" if "429" in error_msg else "connection"
                 error_code = 429 if "429" in error_msg else None
                 error_collector.add_error(self.account.account_index, self.account.name, error_type, error_msg[:100], "websocket", error_code)
-                logger.warning(f"[{self.account.name}] WS connection error (phase {self._retry_phase}, attempt {self._phase_attempts}): {e}")
+                logger.warning("%s WS connection error (phase %d, attempt %d): %s", self._log_prefix, self._retry_phase, self._phase_attempts, e)
                 self._connected = False
             except Exception as e:
                 self._reconnect_count += 1
@@ -273,23 +296,16 @@ class AccountWebSocketConnection:
                 error_type = "429" if "429" in error_msg else "exception"
                 error_code = 429 if "429" in error_msg else None
                 error_collector.add_error(self.account.account_index, self.account.name, error_type, error_msg[:100], "websocket", error_code)
-                logger.warning(f"[{self.account.name}] WS error (phase {self._retry_phase}, attempt {self._phase_attempts}): {e}")
+                logger.warning("%s WS error (phase %d, attempt %d): %s", self._log_prefix, self._retry_phase, self._phase_attempts, e)
                 self._connected = False
             finally:
-                if self._ping_task:
-                    self._ping_task.cancel()
-                    try:
-                        await self._ping_task
-                    except asyncio.CancelledError:
-                        pass
-                    self._ping_task = None
                 if self._session and not self._session.closed:
                     await self._session.close()
                     self._session = None
             
             if self.running:
                 wait_time = self._get_retry_interval()
-                logger.info(f"[{self.account.name}] Reconnecting WS in {wait_time}s (phase {self._retry_phase}, attempt {self._phase_attempts})...")
+                logger.info("%s Reconnecting WS in %ss (phase %d, attempt %d)...", self._log_prefix, wait_time, self._retry_phase, self._phase_attempts)
                 await asyncio.sleep(wait_time)
     
     async def start(self):
@@ -299,13 +315,6 @@ class AccountWebSocketConnection:
     async def stop(self):
         self.running = False
         self._connected = False
-        if self._ping_task:
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
-            self._ping_task = None
         if self._ws:
             try:
                 await self._ws.close()
@@ -332,10 +341,28 @@ class LighterWebSocketClient:
         self.running = False
         self._paused = False
         self._connections: Dict[int, AccountWebSocketConnection] = {}
+        self._connected_cache: bool = False
+        self._connected_expiry: float = 0.0
         self._callbacks: List[Callable] = []
         self._signer_clients: Dict[str, lighter.SignerClient] = {}
         self._start_time: float = 0
-    
+        self._ping_task: Optional[asyncio.Task] = None
+
+    async def _ping_supervisor(self):
+        """Single shared loop that pings all connections every PING_INTERVAL.
+
+        One timer for N accounts instead of one sleeping task per connection.
+        """
+        while self.running:
+            try:
+                await asyncio.sleep(PING_INTERVAL)
+                for conn in list(self._connections.values()):
+                    await conn.check_ping()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"Ping supervisor error: {e}")
+
     def set_signer_clients(self, signer_clients: Dict[str, lighter.SignerClient]):
         self._signer_clients = signer_clients
     
@@ -348,8 +375,7 @@ class LighterWebSocketClient:
         if callback in self._callbacks:
             self._callbacks.remove(callback)
         for conn in self._connections.values():
-            if callback in conn._callbacks:
-                conn._callbacks.remove(callback)
+            conn.remove_callback(callback)
     
     async def start(self):
         """Start all WebSocket connections in parallel"""
@@ -361,33 +387,52 @@ class LighterWebSocketClient:
             return
         
         logger.info(f"Starting {len(settings.accounts)} parallel WebSocket connections...")
-        
-        start_tasks = []
+
         for account in settings.accounts:
             signer = self._signer_clients.get(account.name)
             conn = AccountWebSocketConnection(account, signer)
-            
+
             for callback in self._callbacks:
                 conn.add_callback(callback)
-            
+
             self._connections[account.account_index] = conn
-            start_tasks.append(conn.start())
-        
-        await asyncio.gather(*start_tasks, return_exceptions=True)
-        logger.info(f"All {len(start_tasks)} WebSocket connections started in parallel")
-    
+            # start() only schedules the connect task, so no gather needed
+            await conn.start()
+
+        self._ping_task = asyncio.create_task(self._ping_supervisor())
+        logger.info(f"All {len(self._connections)} WebSocket connections started in parallel")
+
     async def stop(self):
         self.running = False
-        
-        stop_tasks = [conn.stop() for conn in self._connections.values()]
-        if stop_tasks:
-            await asyncio.gather(*stop_tasks, return_exceptions=True)
-        
+
+        if self._ping_task:
+            self._ping_task.cancel()
+            try:
+                await self._ping_task
+            except asyncio.CancelledError:
+                pass
+            self._ping_task = None
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for conn in self._connections.values():
+                    tg.create_task(conn.stop())
+        except* Exception as eg:
+            for exc in eg.exceptions:
+                logger.error(f"Error stopping WebSocket connection: {exc}")
+
         self._connections.clear()
     
     @property
     def is_connected(self) -> bool:
-        return any(conn.is_connected for conn in self._connections.values())
+        # Re-derived on a short jittered interval so status endpoints read
+        # a cached flag instead of scanning every connection per request;
+        # the jitter keeps callers from re-checking in lockstep
+        now = time.time()
+        if now > self._connected_expiry:
+            self._connected_cache = any(conn.is_connected for conn in self._connections.values())
+            self._connected_expiry = now + CONNECTED_CACHE_TTL + random.uniform(0, 0.05)
+        return self._connected_cache
     
     def get_connection_status(self) -> Dict[int, bool]:
         return {acc_id: conn.is_connected for acc_id, conn in self._connections.items()}
@@ -398,16 +443,19 @@ class LighterWebSocketClient:
         connected_count = 0
         total_messages = 0
         total_reconnects = 0
-        
+
+        # One time.time() snapshot shared by every connection so all ages in
+        # the report are relative to the same instant
+        now = time.time()
+
         for conn in self._connections.values():
-            health = conn.get_health_status()
+            health = conn.get_health_status(now)
             connections_health.append(health)
             if health["connected"]:
                 connected_count += 1
             total_messages += health["total_messages"]
             total_reconnects += health["reconnect_count"]
-        
-        now = time.time()
+
         uptime = now - self._start_time if self._start_time > 0 else 0
         
         return {
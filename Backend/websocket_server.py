@@ -1,51 +1,157 @@
 import asyncio
-import json
 import logging
-from typing import Set, Dict, Any
+from typing import Dict, Any, Optional
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+COALESCE_WINDOW = 0.02
+OUT_QUEUE_MAXSIZE = 256
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
-    
+        self.active_connections: Dict[int, WebSocket] = {}
+        self._queues: Dict[int, asyncio.Queue] = {}
+        self._writer_tasks: Dict[int, asyncio.Task] = {}
+        self._pending: Dict[str, Any] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        async with self._lock:
-            self.active_connections.add(websocket)
+        key = id(websocket)
+        self.active_connections[key] = websocket
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUT_QUEUE_MAXSIZE)
+        self._queues[key] = queue
+        self._writer_tasks[key] = asyncio.create_task(self._writer(websocket, queue))
         logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
-    
+
     async def disconnect(self, websocket: WebSocket):
-        async with self._lock:
-            self.active_connections.discard(websocket)
+        key = id(websocket)
+        self.active_connections.pop(key, None)
+        self._queues.pop(key, None)
+        writer = self._writer_tasks.pop(key, None)
+        if writer:
+            writer.cancel()
         logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
-    
+
+    async def _evict_slow_client(self, websocket: WebSocket):
+        """Drop a client whose send queue overflowed and close its socket.
+
+        disconnect() only forgets the connection on our side; without the
+        close the client sits on a half-dead socket instead of reconnecting.
+        1013 (try again later) tells it the eviction was load-related.
+        """
+        logger.warning("Disconnecting slow WebSocket client (send queue full)")
+        await self.disconnect(websocket)
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's outgoing queue so a slow consumer only stalls itself"""
+        try:
+            while True:
+                frame = await queue.get()
+                if queue.empty():
+                    await websocket.send_bytes(frame)
+                    continue
+                # A backlog means the client fell behind during the last
+                # send; ship everything pending as one combined frame
+                frames = [frame]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                await websocket.send_bytes(
+                    b'{"type":"ws_batch","data":[' + b",".join(frames) + b"]}"
+                )
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to client: {e}")
+            await self.disconnect(websocket)
+
+    def enqueue(self, data: Dict[str, Any]):
+        """Coalesce rapid-fire updates per channel and flush them in one batch.
+
+        Keeps only the latest snapshot per channel within COALESCE_WINDOW, so
+        bursty upstream feeds don't turn into one send per frame per client.
+        """
+        if not self.active_connections:
+            return
+
+        payload = data.get("data")
+        channel = payload.get("channel", "") if isinstance(payload, dict) else ""
+        self._pending[channel] = data
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        # Keep flushing windows until one comes up empty: updates enqueued
+        # while the broadcast below awaits land in a fresh _pending, and
+        # enqueue() won't schedule another flush while this task is alive
+        while True:
+            await asyncio.sleep(COALESCE_WINDOW)
+            pending = self._pending
+            self._pending = {}
+            if not pending:
+                return
+            if len(pending) == 1:
+                await self.broadcast(next(iter(pending.values())))
+            else:
+                # One serialization and one fan-out for the whole window
+                await self.broadcast({
+                    "type": "lighter_batch",
+                    "data": [update["data"] for update in pending.values()]
+                })
+
     async def broadcast(self, data: Dict[str, Any]):
         if not self.active_connections:
             return
-        
-        message = json.dumps(data)
-        disconnected = set()
-        
-        async with self._lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send to client: {e}")
-                    disconnected.add(connection)
-        
-        for conn in disconnected:
-            await self.disconnect(conn)
-    
+
+        # Serialize once and fan the same bytes out to every client
+        await self.broadcast_raw(orjson.dumps(data))
+
+    async def broadcast_raw(self, frame: bytes):
+        """Queue an already-serialized frame for every connected client.
+
+        put_nowait never suspends, so the upstream hot path no longer awaits
+        one send per client; clients whose bounded queue overflows are
+        considered too slow and get disconnected instead of buffering
+        unbounded memory.
+        """
+        slow_clients = []
+
+        # No awaits inside the loop, so the dict cannot mutate under us;
+        # iterating it directly skips a list copy per broadcast
+        for key, queue in self._queues.items():
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                slow_clients.append(key)
+
+        for key in slow_clients:
+            websocket = self.active_connections.get(key)
+            if websocket is not None:
+                await self._evict_slow_client(websocket)
+
     async def send_to_client(self, websocket: WebSocket, data: Dict[str, Any]):
+        await self.send_raw_to_client(websocket, orjson.dumps(data))
+
+    async def send_raw_to_client(self, websocket: WebSocket, frame: bytes):
+        queue = self._queues.get(id(websocket))
         try:
-            await websocket.send_text(json.dumps(data))
+            if queue is not None:
+                # Route through the writer queue to keep per-client ordering
+                queue.put_nowait(frame)
+            else:
+                await websocket.send_bytes(frame)
+        except asyncio.QueueFull:
+            await self._evict_slow_client(websocket)
         except Exception as e:
             logger.warning(f"Failed to send to client: {e}")
-    
+
     @property
     def connection_count(self) -> int:
         return len(self.active_connections)
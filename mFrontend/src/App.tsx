@@ -1,7 +1,7 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { AccountCard } from './components/AccountCard';
 import type { PortfolioData, WsHealthData, Position } from './types';
-import { fetchPortfolio, fetchWsHealth, fetchLatency, reconnectWs, fetchRestHealth, fetchErrors, clearErrors, reconnectRest, fetchRawWsMessages, fetchControlStatus, pauseDataCollection, resumeDataCollection } from './api';
+import { fetchDashboardSnapshot, reconnectWs, fetchRestHealth, fetchErrors, clearErrors, reconnectRest, fetchControlStatus, pauseDataCollection, resumeDataCollection } from './api';
 import type { LatencyData, RestHealthData, ErrorsData, RawWsData, ControlStatus } from './api';
 import { formatMoney, getPositionSymbol } from './utils';
 import './App.css';
@@ -15,26 +15,28 @@ function App() {
   const [rawWsMessages, setRawWsMessages] = useState<RawWsData | null>(null);
   const [controlStatus, setControlStatus] = useState<ControlStatus | null>(null);
   const [error, setError] = useState<string | null>(null);
+  const lastPortfolioRef = useRef<string>('');
 
   useEffect(() => {
     const load = async () => {
       try {
-        const [portfolioData, healthData, restHealthData, latencyData, errorsData, rawWsData, controlData] = await Promise.all([
-          fetchPortfolio(),
-          fetchWsHealth().catch(() => null),
-          fetchRestHealth().catch(() => null),
-          fetchLatency().catch(() => null),
-          fetchErrors().catch(() => null),
-          fetchRawWsMessages().catch(() => null),
-          fetchControlStatus().catch(() => null)
-        ]);
-        setPortfolio(portfolioData);
-        setWsHealth(healthData);
-        setRestHealth(restHealthData);
-        setLatency(latencyData);
-        setErrors(errorsData);
-        setRawWsMessages(rawWsData);
-        setControlStatus(controlData);
+        const snapshot = await fetchDashboardSnapshot();
+        // Only the portfolio section is both expensive to render and stable
+        // between rebuilds (the health/latency sections embed uptimes and
+        // timestamps that change on every request), so gate just the
+        // portfolio state on a content compare to keep the accounts grid
+        // referentially stable when nothing changed
+        const portfolioBody = JSON.stringify(snapshot.portfolio);
+        if (portfolioBody !== lastPortfolioRef.current) {
+          lastPortfolioRef.current = portfolioBody;
+          setPortfolio(snapshot.portfolio);
+        }
+        setWsHealth(snapshot.ws_health);
+        setRestHealth(snapshot.rest_health);
+        setLatency(snapshot.latency);
+        setErrors(snapshot.errors);
+        setRawWsMessages(snapshot.raw_ws);
+        setControlStatus(snapshot.control);
         setError(null);
       } catch (e) {
         setError('Failed to load portfolio');
@@ -43,8 +45,50 @@ function App() {
     };
 
     load();
-    const interval = setInterval(load, 500);
-    return () => clearInterval(interval);
+
+    let ws: WebSocket | null = null;
+    let lastPushAt = 0;
+    let reconnectTimer: number | undefined;
+    let debounceTimer: number | undefined;
+    let closed = false;
+
+    // The broadcaster pushes an update over /ws whenever backend data
+    // changes, so the snapshot fetch is driven by those pushes (debounced).
+    // The slow interval is only a safety net: it fetches when the socket
+    // is down or has gone quiet for 30s.
+    const interval = setInterval(() => {
+      if (ws && ws.readyState === WebSocket.OPEN && Date.now() - lastPushAt < 30000) return;
+      load();
+    }, 10000);
+
+    const connect = () => {
+      const base = import.meta.env.VITE_API_BASE || window.location.origin;
+      const url = base.replace(/^http/, 'ws') + '/ws';
+      ws = new WebSocket(url);
+      ws.onmessage = () => {
+        lastPushAt = Date.now();
+        if (debounceTimer === undefined) {
+          debounceTimer = window.setTimeout(() => {
+            debounceTimer = undefined;
+            load();
+          }, 500);
+        }
+      };
+      ws.onclose = () => {
+        if (!closed) {
+          reconnectTimer = window.setTimeout(connect, 5000);
+        }
+      };
+    };
+    connect();
+
+    return () => {
+      closed = true;
+      clearInterval(interval);
+      window.clearTimeout(reconnectTimer);
+      window.clearTimeout(debounceTimer);
+      ws?.close();
+    };
   }, []);
 
   const agg = portfolio?.aggregated;
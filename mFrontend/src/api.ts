@@ -185,6 +185,22 @@ export interface ControlStatus {
   ws_running: boolean;
 }
 
+export interface DashboardSnapshot {
+  portfolio: PortfolioData;
+  ws_health: WsHealthData | null;
+  rest_health: RestHealthData | null;
+  latency: LatencyData | null;
+  errors: ErrorsData | null;
+  raw_ws: RawWsData | null;
+  control: ControlStatus | null;
+}
+
+export async function fetchDashboardSnapshot(): Promise<DashboardSnapshot> {
+  const res = await fetch(`${API_BASE}/api/dashboard_snapshot`);
+  if (!res.ok) throw new Error('Failed to fetch dashboard snapshot');
+  return res.json();
+}
+
 export async function fetchControlStatus(): Promise<ControlStatus> {
   const res = await fetch(`${API_BASE}/api/control/status`);
   if (!res.ok) throw new Error('Failed to fetch control status');
@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import type { Account, Position, Order, Trade } from '../types';
 import { formatMoney, formatAccountName, getPositionSymbol, formatTime } from '../utils';
 import './AccountCard.css';
@@ -6,7 +7,28 @@ interface Props {
   account: Account;
 }
 
-export function AccountCard({ account }: Props) {
+// Each snapshot fetch rebuilds the account objects, so reference
+// equality never holds; compare the scalar fields the card actually
+// renders to skip re-rendering accounts whose data hasn't moved.
+function accountUnchanged(prev: Props, next: Props): boolean {
+  const a = prev.account;
+  const b = next.account;
+  return (
+    a.is_live === b.is_live &&
+    a.last_update === b.last_update &&
+    a.equity === b.equity &&
+    a.unrealized_pnl === b.unrealized_pnl &&
+    a.volume_24h === b.volume_24h &&
+    a.weekly_volume === b.weekly_volume &&
+    a.monthly_volume === b.monthly_volume &&
+    a.total_volume === b.total_volume &&
+    a.open_positions_count === b.open_positions_count &&
+    a.active_orders_count === b.active_orders_count &&
+    a.trades_count === b.trades_count
+  );
+}
+
+export const AccountCard = memo(function AccountCard({ account }: Props) {
   const equity = parseFloat(account.equity || '0');
   const pnl = parseFloat(account.unrealized_pnl || '0');
   const volume24h = parseFloat(account.volume_24h || '0');
@@ -15,10 +37,11 @@ export function AccountCard({ account }: Props) {
   const totalVolume = parseFloat(account.total_volume || '0');
   const dataAge = account.last_update ? (Date.now() / 1000) - account.last_update : 0;
 
-  const openPositions = account.positions.filter(p => {
-    const size = parseFloat(p.position || p.signed_size || p.size || '0');
-    return size !== 0;
-  });
+  // The backend already filters zero-size positions and truncates the
+  // order/trade arrays; the *_count fields carry the full totals
+  const openPositions = account.positions;
+  const ordersCount = account.active_orders_count ?? account.active_orders.length;
+  const tradesCount = account.trades_count ?? account.trades.length;
 
   return (
     <div className="account-card">
@@ -49,7 +72,7 @@ export function AccountCard({ account }: Props) {
         </div>
         <div className="stat-item">
           <div className="stat-label">Active Orders</div>
-          <div className="stat-value">{account.active_orders.length}</div>
+          <div className="stat-value">{ordersCount}</div>
         </div>
         <div className="stat-item">
           <div className="stat-label">Data Age</div>
@@ -79,31 +102,31 @@ export function AccountCard({ account }: Props) {
       </div>
 
       <div className="section">
-        <div className="section-header">Otwarte Zlecenia ({account.active_orders.length})</div>
+        <div className="section-header">Otwarte Zlecenia ({ordersCount})</div>
         <div className="list">
           {account.active_orders.length > 0 ? account.active_orders.slice(0, 5).map((order, i) => (
             <OrderRow key={i} order={order} />
           )) : <span className="no-data">Brak otwartych zleceń</span>}
-          {account.active_orders.length > 5 && (
-            <div className="more">+{account.active_orders.length - 5} więcej zleceń</div>
+          {ordersCount > 5 && (
+            <div className="more">+{ordersCount - 5} więcej zleceń</div>
           )}
         </div>
       </div>
 
       <div className="section">
-        <div className="section-header">Historia Transakcji ({account.trades.length})</div>
+        <div className="section-header">Historia Transakcji ({tradesCount})</div>
         <div className="list">
           {account.trades.length > 0 ? account.trades.slice(0, 3).map((trade, i) => (
             <TradeRow key={i} trade={trade} />
           )) : <span className="no-data">Brak transakcji</span>}
-          {account.trades.length > 3 && (
-            <div className="more">+{account.trades.length - 3} więcej transakcji</div>
+          {tradesCount > 3 && (
+            <div className="more">+{tradesCount - 3} więcej transakcji</div>
           )}
         </div>
       </div>
     </div>
   );
-}
+}, accountUnchanged);
 
 function PositionRow({ position }: { position: Position }) {
   const size = parseFloat(position.position || position.signed_size || position.size || '0');
@@ -41,8 +41,11 @@ export interface Account {
   monthly_volume?: string;
   total_volume?: string;
   positions: Position[];
+  open_positions_count?: number;
   active_orders: Order[];
+  active_orders_count?: number;
   trades: Trade[];
+  trades_count?: number;
 }
 
 export interface PortfolioData {
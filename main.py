@@ -1,12 +1,28 @@
 import uvicorn
-from Backend.api import app
 from Backend.config import settings
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools
+except ImportError:
+    httptools = None
+
 if __name__ == "__main__":
     uvicorn.run(
         "Backend.api:app",
         host=settings.host,
         port=settings.port,
         reload=False,
-        log_level="info"
+        log_level="info",
+        loop="uvloop" if uvloop else "auto",
+        http="httptools" if httptools else "auto",
+        # Must stay single-worker: the cache, WS fanout, and rate limiter
+        # all live in process memory. Scaling out needs a shared store
+        # (e.g. Redis) for account:* keys and a pub/sub broadcast bus first.
+        workers=1
     )